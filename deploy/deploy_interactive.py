@@ -200,16 +200,18 @@ def deploy_all_contracts():
         config_manager = ConfigManager()
         
         # Import deploy function
-        from kliver_deploy.deploy import deploy_all_contracts as deploy_all
+        from kliver_deploy.deploy import DeployOptions, deploy_all_contracts as deploy_all
         
         deployments = []
         success = deploy_all(
             config_manager,
-            environment,
-            owner if owner else None,
-            verifier,
+            DeployOptions(
+                environment=environment,
+                contract='all',
+                owner=owner if owner else None,
+                verifier_address=verifier,
+            ),
             deployments,
-            no_compile=False
         )
         
         if success:
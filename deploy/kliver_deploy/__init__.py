@@ -9,13 +9,35 @@ support for multiple environments and contract types.
 __version__ = "1.0.0"
 __author__ = "Kliver Team"
 
-from .deployer import ContractDeployer
-from .config import ConfigManager
-from .contracts import *
+from importlib import import_module
+
+# Submodules are imported on first use, so entry points that never deploy
+# (e.g. `--help`) don't pay for the deployer/config/yaml import chain.
+_LAZY_ATTRIBUTES = {
+    "ContractDeployer": ".deployer",
+    "DeploySpec": ".deployer",
+    "deploy_many": ".deployer",
+    "ConfigManager": ".config",
+    "ConfigError": ".config",
+}
+
+
+def __getattr__(name):
+    module = import_module(_LAZY_ATTRIBUTES.get(name, ".contracts"), __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ContractDeployer",
+    "DeploySpec",
+    "deploy_many",
     "ConfigManager",
+    "ConfigError",
     "KliverNFT",
     "KliverRegistry", 
     "KliverNFT1155"
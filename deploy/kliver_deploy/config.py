@@ -4,9 +4,15 @@ Configuration management for Kliver contract deployments.
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from dataclasses import dataclass
 
+from .utils import uses_sncast_profile
+
+
+class ConfigError(ValueError):
+    """Raised when deployment_config.yml is missing data the deployer needs."""
+
 
 @dataclass
 class NetworkConfig:
@@ -19,6 +25,11 @@ class NetworkConfig:
     description: str
     account: str
     build_target: str
+
+    @property
+    def is_profile_mode(self) -> bool:
+        """Local networks are addressed through an sncast profile instead of --account/--network."""
+        return uses_sncast_profile(self.network)
     
 
 @dataclass
@@ -39,6 +50,8 @@ class DeploymentSettings:
     wait_timeout: int = 120
     retry_interval: int = 2
     max_retries: int = 20
+    debug: bool = False
+    validation_cache_ttl: int = 3600
 
 
 class ConfigManager:
@@ -68,25 +81,50 @@ class ConfigManager:
         
         self.config_path = config_path
         self._config_data: Optional[Dict[str, Any]] = None
+        self._config_mtime: Optional[int] = None
+        self._environment_configs: Dict[str, NetworkConfig] = {}
+        self._contract_configs: Dict[Tuple[str, str], ContractConfig] = {}
+        self._deployment_settings: Dict[str, DeploymentSettings] = {}
+        self._valid_environments: Optional[FrozenSet[str]] = None
+        self._valid_contracts: Dict[str, FrozenSet[str]] = {}
+        self._enabled_contracts: Dict[str, FrozenSet[str]] = {}
         
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        if self._config_data is None:
-            if not self.config_path.exists():
-                raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-            
+        """Load configuration from YAML file (re-parsed only when the file changes)."""
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
+
+        if self._config_data is None or mtime != self._config_mtime:
             with open(self.config_path, 'r') as f:
-                self._config_data = yaml.safe_load(f)
-                
+                config_data = yaml.safe_load(f)
+            if self._config_data is not None:
+                self._clear_derived_caches()
+            self._config_data = config_data
+            self._config_mtime = mtime
+
         return self._config_data
+
+    def _clear_derived_caches(self) -> None:
+        """Drop everything built from a previous version of the config file."""
+        self._environment_configs.clear()
+        self._contract_configs.clear()
+        self._deployment_settings.clear()
+        self._valid_environments = None
+        self._valid_contracts.clear()
+        self._enabled_contracts.clear()
     
     def get_environment_config(self, environment: str) -> NetworkConfig:
-        """Get configuration for a specific environment."""
+        """Get configuration for a specific environment (cached per environment)."""
         config = self.load_config()
+        cached = self._environment_configs.get(environment)
+        if cached is not None:
+            return cached
         
         if environment not in config.get("environments", {}):
             available = list(config.get("environments", {}).keys())
-            raise ValueError(f"Environment '{environment}' not found. Available: {available}")
+            raise ConfigError(f"Environment '{environment}' not found. Available: {available}")
         
         env_data = config["environments"][environment]
         
@@ -94,9 +132,9 @@ class ConfigManager:
         required_fields = ['name', 'network', 'rpc_url', 'account']
         for field in required_fields:
             if field not in env_data:
-                raise ValueError(f"Missing required field '{field}' in environment '{environment}'")
+                raise ConfigError(f"Missing required field '{field}' in environment '{environment}'")
         
-        return NetworkConfig(
+        network_config = NetworkConfig(
             name=env_data['name'],
             network=env_data['network'],
             rpc_url=env_data['rpc_url'],
@@ -106,21 +144,26 @@ class ConfigManager:
             account=env_data['account'],
             build_target=env_data.get('build_target', 'dev')
         )
+        self._environment_configs[environment] = network_config
+        return network_config
     
     def get_contract_config(self, environment: str, contract_name: str) -> ContractConfig:
-        """Get configuration for a specific contract in an environment."""
+        """Get configuration for a specific contract in an environment (cached)."""
         config = self.load_config()
+        cached = self._contract_configs.get((environment, contract_name))
+        if cached is not None:
+            return cached
         
         env_config = config["environments"][environment]
         contracts = env_config.get("contracts", {})
         
         if contract_name not in contracts:
             available = list(contracts.keys())
-            raise ValueError(f"Contract '{contract_name}' not found in environment '{environment}'. Available: {available}")
+            raise ConfigError(f"Contract '{contract_name}' not found in environment '{environment}'. Available: {available}")
         
         contract_data = contracts[contract_name]
         
-        return ContractConfig(
+        contract_config = ContractConfig(
             name=contract_data['name'],
             sierra_file=contract_data['sierra_file'],
             base_uri=contract_data.get('base_uri'),
@@ -129,19 +172,28 @@ class ConfigManager:
             payment_token_address=contract_data.get('payment_token_address'),
             purchase_timeout_seconds=contract_data.get('purchase_timeout_seconds'),
         )
+        self._contract_configs[(environment, contract_name)] = contract_config
+        return contract_config
     
     def get_deployment_settings(self, environment: str) -> DeploymentSettings:
-        """Get deployment settings for an environment."""
+        """Get deployment settings for an environment (cached per environment)."""
         config = self.load_config()
+        cached = self._deployment_settings.get(environment)
+        if cached is not None:
+            return cached
         
         env_config = config["environments"][environment]
         settings_data = env_config.get("deployment_settings", {})
         
-        return DeploymentSettings(
+        settings = DeploymentSettings(
             wait_timeout=settings_data.get('wait_timeout', 120),
             retry_interval=settings_data.get('retry_interval', 2),
-            max_retries=settings_data.get('max_retries', 20)
+            max_retries=settings_data.get('max_retries', 20),
+            debug=bool(settings_data.get('debug', False)),
+            validation_cache_ttl=settings_data.get('validation_cache_ttl', 3600)
         )
+        self._deployment_settings[environment] = settings
+        return settings
     
     def get_available_environments(self) -> list[str]:
         """Get list of available environments."""
@@ -153,3 +205,34 @@ class ConfigManager:
         config = self.load_config()
         env_config = config["environments"][environment]
         return list(env_config.get("contracts", {}).keys())
+
+    def get_enabled_contracts(self, environment: str) -> FrozenSet[str]:
+        """Get the set of contracts configured for an environment (cached)."""
+        config = self.load_config()
+        enabled = self._enabled_contracts.get(environment)
+        if enabled is None:
+            environments = config.get("environments") or {}
+            if environment not in environments:
+                raise ConfigError(f"Environment '{environment}' not found. Available: {list(environments.keys())}")
+            contracts = environments[environment].get("contracts") or {}
+            if not isinstance(contracts, dict):
+                raise ConfigError(f"'contracts' in environment '{environment}' must be a mapping")
+            enabled = frozenset(contracts)
+            self._enabled_contracts[environment] = enabled
+        return enabled
+
+    def valid_environments(self) -> FrozenSet[str]:
+        """Get the set of environment names accepted by the CLI (cached)."""
+        self.load_config()
+        if self._valid_environments is None:
+            self._valid_environments = frozenset(self.get_available_environments())
+        return self._valid_environments
+
+    def get_available_contracts_with_all(self, environment: str) -> FrozenSet[str]:
+        """Get the set of contract names accepted for an environment, including 'all' (cached)."""
+        self.load_config()
+        valid = self._valid_contracts.get(environment)
+        if valid is None:
+            valid = self.get_enabled_contracts(environment) | {'all'}
+            self._valid_contracts[environment] = valid
+        return valid
@@ -5,6 +5,7 @@ Kliver Contracts Configuration CLI
 Tool for configuring deployed contracts (setting addresses, updating references, etc.)
 """
 
+import sys
 import click
 from typing import Optional
 
@@ -56,14 +57,14 @@ def set_registry(environment: str, contract_address: str, registry_address: str,
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set registry address{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -99,14 +100,14 @@ def set_pox(environment: str, registry_address: str, pox_address: str):
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set KliverPox address{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -142,14 +143,14 @@ def set_verifier(environment: str, registry_address: str, verifier_address: str)
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set verifier address{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -184,14 +185,14 @@ def get_address(environment: str, contract_address: str, method: str):
         
         if result:
             click.echo(f"{Colors.SUCCESS}✅ Result: {result}{Colors.RESET}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"{Colors.ERROR}❌ Failed to call method{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -227,14 +228,14 @@ def set_payment_token(environment: str, marketplace_address: str, payment_token_
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set payment token address{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -270,14 +271,14 @@ def set_marketplace_pox(environment: str, marketplace_address: str, pox_address:
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set KliverPox address{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -313,14 +314,14 @@ def set_timeout(environment: str, marketplace_address: str, timeout: int):
             click.echo(f"  Transaction: {result['tx_hash']}")
             if result.get('validation'):
                 click.echo(f"  {result['validation']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to set purchase timeout{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 @cli.command()
@@ -358,14 +359,14 @@ def invoke(environment: str, contract_address: str, method: str, calldata: tuple
         if result:
             click.echo(f"\n{Colors.SUCCESS}✅ Method invoked successfully!{Colors.RESET}")
             click.echo(f"  Transaction: {result['tx_hash']}")
-            exit(0)
+            sys.exit(0)
         else:
             click.echo(f"\n{Colors.ERROR}❌ Failed to invoke method{Colors.RESET}")
-            exit(1)
+            sys.exit(1)
             
     except Exception as e:
         click.echo(f"\n{Colors.ERROR}❌ Error: {str(e)}{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ Contract classes for Kliver deployment system.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from .utils import StarknetUtils, Colors
 from .config import ContractConfig
@@ -119,8 +120,9 @@ CONTRACTS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_contract(contract_type: str) -> BaseContract:
-    """Get a contract instance by type."""
+    """Get a contract instance by type (contracts are stateless, so one instance per type is shared)."""
     if contract_type not in CONTRACTS:
         available = list(CONTRACTS.keys())
         raise ValueError(f"Unknown contract type '{contract_type}'. Available: {available}")
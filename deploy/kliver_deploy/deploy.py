@@ -5,11 +5,59 @@ Kliver Contracts Deployment CLI
 Modern, object-oriented deployment system for Kliver smart contracts.
 """
 
+import sys
 import click
-from typing import Optional, List, Dict, Any
-
-from kliver_deploy import ConfigManager, ContractDeployer
-from kliver_deploy.utils import Colors, print_deployment_summary, print_deployment_json, format_address
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any
+
+from kliver_deploy.utils import (
+    Colors, SUCCESS_TPL, ERROR_TPL, SEP_EQ_BOLD, SEP_DASH_BOLD, CommandRunner, StarknetUtils,
+    print_deployment_summary, print_deployment_json, format_address, canon, run_in_parallel, sncast_command,
+)
+
+if TYPE_CHECKING:
+    from kliver_deploy.config import ConfigManager, NetworkConfig
+
+# Colored line templates for the comprehensive summary, built once
+_CONTRACT_TPL = f"\n{Colors.BOLD}{Colors.INFO}Contract {{}}: {{}}{Colors.RESET}"
+_ADDRESS_TPL = f"   Address: {Colors.SUCCESS}{{}}{Colors.RESET}"
+_TX_HASH_TPL = f"   Transaction Hash: {Colors.INFO}{{}}{Colors.RESET}"
+_PARAM_TRUNCATED_TPL = f"   {{}}: {Colors.CYAN}{{}}...{Colors.RESET}"
+_PARAM_ADDRESS_TPL = f"   {{}}: {Colors.INFO}{{}}{Colors.RESET}"
+_OP_METHOD_TPL = f"   {{}}. {Colors.BOLD}{{}}(){Colors.RESET}"
+_OP_TX_TPL = f"      Transaction: {Colors.INFO}{{}}{Colors.RESET}"
+_OP_VALIDATION_TPL = f"      Validation: {Colors.SUCCESS}{{}}{Colors.RESET}"
+
+
+@dataclass(frozen=True)
+class DeployOptions:
+    """Everything a deployment run needs from the command line, built once."""
+    environment: str
+    contract: str = 'registry'
+    owner: Optional[str] = None
+    nft_address: Optional[str] = None
+    token_simulation_address: Optional[str] = None
+    verifier_address: Optional[str] = None
+    registry_address: Optional[str] = None
+    pox_address: Optional[str] = None
+    payment_token_address: Optional[str] = None
+    purchase_timeout: Optional[int] = None
+    no_compile: bool = False
+    reuse_deployments: bool = False
+    output_json: bool = False
+
+
+class DeployError(click.ClickException):
+    """Raised when a deployment cannot be started with the given arguments."""
+
+    def __init__(self, message: str, hint: Optional[str] = None):
+        super().__init__(message)
+        self.hint = hint
+
+    def show(self, file=None) -> None:
+        click.echo(ERROR_TPL.format(f"\n❌ {self.format_message()}"), file=file)
+        if self.hint:
+            click.echo(f"{Colors.INFO}{self.hint}{Colors.RESET}\n", file=file)
 
 
 @click.command()
@@ -37,12 +85,15 @@ from kliver_deploy.utils import Colors, print_deployment_summary, print_deployme
               help='Enable verbose output')
 @click.option('--no-compile', is_flag=True, 
               help='Skip compilation step (use existing compiled contracts)')
+@click.option('--reuse-deployments', is_flag=True,
+              help='Reuse contracts already deployed from the same artifact with the same arguments '
+                   '(deployments are only recorded by runs with this flag)')
 @click.option('--output-json', is_flag=True, 
               help='Output deployment addresses in JSON format')
 def deploy(environment: str, contract: str, owner: Optional[str],
            nft_address: Optional[str], token_simulation_address: Optional[str], verifier_address: Optional[str],
            registry_address: Optional[str], pox_address: Optional[str], payment_token_address: Optional[str], purchase_timeout: Optional[int],
-           verbose: bool, no_compile: bool, output_json: bool):
+           verbose: bool, no_compile: bool, reuse_deployments: bool, output_json: bool):
     """
     Deploy Kliver contracts to StarkNet using environment-based configuration.
     
@@ -75,395 +126,408 @@ def deploy(environment: str, contract: str, owner: Optional[str],
     """
     
     try:
-        # Initialize configuration manager
-        config_manager = ConfigManager()
-        
-        # Validate environment
-        available_envs = config_manager.get_available_environments()
-        if environment not in available_envs:
-            click.echo(f"{Colors.ERROR}❌ Invalid environment '{environment}'. Available: {available_envs}{Colors.RESET}")
-            exit(1)
-        
-        # Load environment configuration
-        env_config = config_manager.get_environment_config(environment)
-        click.echo(f"{Colors.SUCCESS}✓ Environment '{environment}' loaded:{Colors.RESET}")
-        click.echo(f"  Environment: {env_config.name}")
-        click.echo(f"  Network: {env_config.network}")
-        click.echo(f"  Account: {env_config.account}")
-        click.echo(f"  RPC URL: {env_config.rpc_url}")
-        
-        # Validate contract type
-        available_contracts = config_manager.get_available_contracts(environment)
-        if contract not in available_contracts + ['all']:
-            click.echo(f"{Colors.ERROR}❌ Invalid contract type '{contract}'. Available: {available_contracts + ['all']}{Colors.RESET}")
-            exit(1)
-            
-        deployments: List[Dict[str, Any]] = []
-        success = True
-        
-        if contract == 'all':
-            success = deploy_all_contracts(
-                config_manager, environment, owner, verifier_address, deployments, no_compile,
-                payment_token_address=payment_token_address, purchase_timeout=purchase_timeout
-            )
-        else:
-            success = deploy_single_contract(
-                config_manager, environment, contract, owner,
-                nft_address, token_simulation_address, registry_address, pox_address, verifier_address,
-                deployments=deployments, no_compile=no_compile,
-                payment_token_address=payment_token_address, purchase_timeout=purchase_timeout,
-            )
-        
-        # Show final summary
-        if success and deployments:
-            if output_json:
-                print_deployment_json(deployments)
-            elif contract == 'all':
-                # Comprehensive summary already printed in deploy_all_contracts
-                pass
-            else:
-                # Print comprehensive summary for single contract deployments
-                print_comprehensive_summary(deployments, env_config.network)
-            exit(0)
-        else:
-            click.echo(f"\n{Colors.ERROR}❌ Deployment failed. Check the logs above for details.{Colors.RESET}")
-            exit(1)
-            
+        sys.exit(run_deploy(DeployOptions(
+            environment=environment, contract=contract, owner=owner,
+            nft_address=nft_address, token_simulation_address=token_simulation_address,
+            verifier_address=verifier_address, registry_address=registry_address,
+            pox_address=pox_address, payment_token_address=payment_token_address,
+            purchase_timeout=purchase_timeout, no_compile=no_compile,
+            reuse_deployments=reuse_deployments, output_json=output_json,
+        )))
+    except DeployError as e:
+        e.show()
+        sys.exit(e.exit_code)
     except KeyboardInterrupt:
         click.echo(f"\n{Colors.WARNING}⚠️  Deployment interrupted by user{Colors.RESET}")
-        exit(1)
+        sys.exit(1)
     except Exception as e:
-        click.echo(f"\n{Colors.ERROR}❌ Unexpected error: {str(e)}{Colors.RESET}")
+        click.echo(ERROR_TPL.format(f"\n❌ Unexpected error: {str(e)}"))
         if verbose:
             import traceback
             traceback.print_exc()
-        exit(1)
+        sys.exit(1)
+
+
+def run_deploy(opts: DeployOptions, config_manager: Optional["ConfigManager"] = None) -> int:
+    """
+    Run a deployment without going through Click.
+
+    Returns the process exit status (0 on success, 1 on failure) and raises
+    DeployError when the requested environment or contract is invalid, so it
+    can be called repeatedly from the same interpreter.
+    """
+    environment, contract = opts.environment, opts.contract
+
+    # Deployment modules are only loaded once a deployment actually runs
+    from kliver_deploy.config import ConfigManager
+
+    # Initialize configuration manager
+    config_manager = config_manager or ConfigManager()
+    
+    # Validate environment
+    valid_envs = config_manager.valid_environments()
+    if environment not in valid_envs:
+        raise DeployError(f"Invalid environment '{environment}'. Available: {sorted(valid_envs)}")
+    
+    # Load environment configuration
+    env_config = config_manager.get_environment_config(environment)
+    click.echo("\n".join([
+        f"{Colors.SUCCESS}✓ Environment '{environment}' loaded:{Colors.RESET}",
+        f"  Environment: {env_config.name}",
+        f"  Network: {env_config.network}",
+        f"  Account: {env_config.account}",
+        f"  RPC URL: {env_config.rpc_url}",
+    ]))
+    
+    # Validate contract type
+    valid_contracts = config_manager.get_available_contracts_with_all(environment)
+    if contract not in valid_contracts:
+        raise DeployError(f"Invalid contract type '{contract}'. Available: {sorted(valid_contracts)}")
+        
+    deployments: List[Dict[str, Any]] = []
+    success = True
+    
+    if contract == 'all':
+        success = deploy_all_contracts(config_manager, opts, deployments)
+    else:
+        success = deploy_single_contract(config_manager, opts, deployments)
+    
+    # Show final summary
+    if success and deployments:
+        if opts.output_json:
+            print_deployment_json(deployments)
+        elif contract == 'all':
+            # Comprehensive summary already printed in deploy_all_contracts
+            pass
+        else:
+            # Print comprehensive summary for single contract deployments
+            print_comprehensive_summary(deployments, env_config.network)
+        return 0
+
+    click.echo(ERROR_TPL.format("\n❌ Deployment failed. Check the logs above for details."))
+    return 1
+
+
+def _summary_param_line(param: str, value: Any) -> str:
+    """One constructor parameter line: long values truncated, addresses highlighted."""
+    if isinstance(value, str) and len(value) > 40:
+        return _PARAM_TRUNCATED_TPL.format(param, value[:37])
+    if param.endswith('_address'):
+        return _PARAM_ADDRESS_TPL.format(param, value)
+    return f"   {param}: {value}"
+
+
+def _summary_op_lines(index: int, op: Dict[str, Any]) -> List[str]:
+    """Lines describing one post-deployment operation."""
+    lines = [_OP_METHOD_TPL.format(index, op['method'])]
+    if op.get('tx_hash'):
+        lines.append(_OP_TX_TPL.format(op['tx_hash']))
+    if op.get('params'):
+        lines.append(f"      Parameters: {op['params']}")
+    if op.get('validation'):
+        lines.append(_OP_VALIDATION_TPL.format(op['validation']))
+    return lines
+
+
+def _summary_deployment_lines(index: int, deployment: Dict[str, Any]) -> List[str]:
+    """All summary lines for one deployed contract."""
+    lines = [
+        _CONTRACT_TPL.format(index, deployment['contract_name'].upper()),
+        SEP_DASH_BOLD,
+        f"📋 {Colors.BOLD}Contract Details:{Colors.RESET}",
+        f"   Name: {deployment['contract_name']}",
+        f"   Type: {deployment['contract_type']}",
+        _ADDRESS_TPL.format(deployment['contract_address']),
+        f"   Class Hash: {deployment['class_hash']}",
+        f"   Owner: {format_address(deployment['owner'])}",
+    ]
+
+    # Deployment transaction
+    if deployment.get('deployment_tx_hash'):
+        lines += [
+            f"\n🚀 {Colors.BOLD}Deployment Transaction:{Colors.RESET}",
+            _TX_HASH_TPL.format(deployment['deployment_tx_hash']),
+            f"   Status: {Colors.SUCCESS}✓ Confirmed{Colors.RESET}",
+        ]
+
+    # Constructor parameters
+    params = deployment.get('constructor_params')
+    if params:
+        lines.append(f"\n⚙️  {Colors.BOLD}Constructor Parameters:{Colors.RESET}")
+        lines += [_summary_param_line(param, value) for param, value in params.items()]
+
+    # Post-deployment operations
+    ops = deployment.get('post_deployment_ops')
+    if ops:
+        lines.append(f"\n🔧 {Colors.BOLD}Post-Deployment Operations:{Colors.RESET}")
+        lines += [line for j, op in enumerate(ops, 1) for line in _summary_op_lines(j, op)]
+
+    # Dependencies
+    dependencies = deployment.get('dependencies')
+    if dependencies:
+        lines.append(f"\n🔗 {Colors.BOLD}Dependencies:{Colors.RESET}")
+        lines += [f"   {name.title()}: {value}" for name, value in dependencies.items()]
+
+    return lines
 
 
 def print_comprehensive_summary(deployments: List[Dict[str, Any]], network: str):
     """Print a comprehensive professional deployment summary."""
-    print(f"\n{Colors.BOLD}{'='*100}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}🎯 COMPLETE DEPLOYMENT SUMMARY - {network.upper()}{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*100}{Colors.RESET}")
-
-    for i, deployment in enumerate(deployments, 1):
-        print(f"\n{Colors.BOLD}{Colors.INFO}Contract {i}: {deployment['contract_name'].upper()}{Colors.RESET}")
-        print(f"{Colors.BOLD}{'-'*50}{Colors.RESET}")
-
-        # Basic contract info
-        print(f"📋 {Colors.BOLD}Contract Details:{Colors.RESET}")
-        print(f"   Name: {deployment['contract_name']}")
-        print(f"   Type: {deployment['contract_type']}")
-        print(f"   Address: {Colors.SUCCESS}{deployment['contract_address']}{Colors.RESET}")
-        print(f"   Class Hash: {deployment['class_hash']}")
-        print(f"   Owner: {format_address(deployment['owner'])}")
-
-        # Deployment transaction
-        if deployment.get('deployment_tx_hash'):
-            print(f"\n🚀 {Colors.BOLD}Deployment Transaction:{Colors.RESET}")
-            print(f"   Transaction Hash: {Colors.INFO}{deployment['deployment_tx_hash']}{Colors.RESET}")
-            print(f"   Status: {Colors.SUCCESS}✓ Confirmed{Colors.RESET}")
-
-        # Constructor parameters
-        if deployment.get('constructor_params'):
-            print(f"\n⚙️  {Colors.BOLD}Constructor Parameters:{Colors.RESET}")
-            for param, value in deployment['constructor_params'].items():
-                if isinstance(value, str) and len(value) > 40:
-                    print(f"   {param}: {Colors.CYAN}{value[:37]}...{Colors.RESET}")
-                elif param.endswith('_address'):
-                    print(f"   {param}: {Colors.INFO}{value}{Colors.RESET}")
-                else:
-                    print(f"   {param}: {value}")
-
-        # Post-deployment operations
-        if deployment.get('post_deployment_ops'):
-            print(f"\n🔧 {Colors.BOLD}Post-Deployment Operations:{Colors.RESET}")
-            for j, op in enumerate(deployment['post_deployment_ops'], 1):
-                print(f"   {j}. {Colors.BOLD}{op['method']}(){Colors.RESET}")
-                if op.get('tx_hash'):
-                    print(f"      Transaction: {Colors.INFO}{op['tx_hash']}{Colors.RESET}")
-                if op.get('params'):
-                    print(f"      Parameters: {op['params']}")
-                if op.get('validation'):
-                    print(f"      Validation: {Colors.SUCCESS}{op['validation']}{Colors.RESET}")
-
-        # Dependencies
-        deps = []
-        for key, value in deployment.items():
-            if key.endswith('_address') and key != 'contract_address':
-                deps.append(f"{key.replace('_address', '').title()}: {value}")
-
-        if deps:
-            print(f"\n🔗 {Colors.BOLD}Dependencies:{Colors.RESET}")
-            for dep in deps:
-                print(f"   {dep}")
-
-    print(f"\n{Colors.BOLD}{'='*100}{Colors.RESET}")
-    print(f"{Colors.SUCCESS}✅ ALL CONTRACTS DEPLOYED AND CONFIGURED SUCCESSFULLY!{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*100}{Colors.RESET}")
-
-
-def deploy_all_contracts(config_manager: ConfigManager, environment: str,
-                         owner: Optional[str], verifier_address: Optional[str],
-                         deployments: List[Dict[str, Any]], no_compile: bool = False,
-                         payment_token_address: Optional[str] = None, purchase_timeout: Optional[int] = None) -> bool:
+    # Assemble the whole report first and write it in one go
+    lines = [
+        "\n" + SEP_EQ_BOLD,
+        f"{Colors.BOLD}{Colors.CYAN}🎯 COMPLETE DEPLOYMENT SUMMARY - {network.upper()}{Colors.RESET}",
+        SEP_EQ_BOLD,
+        *(line for i, deployment in enumerate(deployments, 1) for line in _summary_deployment_lines(i, deployment)),
+        "\n" + SEP_EQ_BOLD,
+        f"{Colors.SUCCESS}✅ ALL CONTRACTS DEPLOYED AND CONFIGURED SUCCESSFULLY!{Colors.RESET}",
+        SEP_EQ_BOLD,
+    ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def make_sncast(env_cfg: "NetworkConfig") -> Callable[..., List[str]]:
+    """
+    Build an sncast command builder bound to one environment.
+
+    Flags come from utils.sncast_command, like every other sncast call; the
+    returned function only appends the subcommand target, e.g.
+    ``sncast("invoke", registry, "set_kliver_pox_address", calldata=[pox])``.
+    """
+    def sncast(subcommand: str, contract_address: str, function: str,
+               calldata: Optional[List[str]] = None) -> List[str]:
+        calldata_args = ("--calldata", *calldata) if calldata else ()
+        return sncast_command(env_cfg.account, env_cfg.network, subcommand,
+                              "--contract-address", contract_address, "--function", function, *calldata_args)
+
+    return sncast
+
+
+def verify_address_wiring(env_cfg: "NetworkConfig", contract_address: str, getter: str,
+                          expected_address: str, label: str) -> bool:
+    """Check that `getter` on a contract returns the expected address (warns on mismatch)."""
+    base_verify = make_sncast(env_cfg)("call", contract_address, getter)
+
+    verify = CommandRunner.run_command(base_verify, f"Verifying {label}")
+    if not verify["success"]:
+        click.echo(f"{Colors.WARNING}⚠️ Could not verify {label} via {getter}{Colors.RESET}")
+        return False
+    try:
+        returned_address = StarknetUtils.parse_contract_address_from_call(verify["stdout"])
+    except ValueError as e:
+        click.echo(f"{Colors.WARNING}⚠️ Could not parse address from {getter} output: {str(e)}{Colors.RESET}")
+        return False
+    if canon(returned_address) != canon(expected_address):
+        click.echo(f"{Colors.WARNING}⚠️ {label} mismatch. Expected: {expected_address}, Got: {returned_address}{Colors.RESET}")
+        return False
+    click.echo(SUCCESS_TPL.format(f"✓ Verified {label}: {expected_address}"))
+    return True
+
+
+def deploy_all_contracts(config_manager: "ConfigManager", opts: DeployOptions,
+                         deployments: List[Dict[str, Any]]) -> bool:
     """Deploy all contracts in the correct order."""
-    click.echo(f"\n{Colors.BOLD}🚀 COMPLETE DEPLOYMENT MODE{Colors.RESET}")
-    click.echo(f"{Colors.INFO}This will deploy: NFT → TokenSimulation → Registry → KliverPox → SessionsMarketplace{Colors.RESET}\n")
+    from kliver_deploy.deployer import ContractDeployer
+
+    environment, owner, no_compile = opts.environment, opts.owner, opts.no_compile
+    reuse = opts.reuse_deployments
+    click.echo(
+        f"\n{Colors.BOLD}🚀 COMPLETE DEPLOYMENT MODE{Colors.RESET}\n"
+        f"{Colors.INFO}This will deploy: (NFT ‖ TokenSimulation) → Registry → KliverPox → SessionsMarketplace{Colors.RESET}\n"
+    )
 
     deployed_addresses = {}
 
-    # Step 1: Deploy NFT
-    click.echo(f"{Colors.BOLD}Step 1/5: Deploying NFT Contract{Colors.RESET}")
+    # Resolve configuration once for the whole run
+    env_cfg = config_manager.get_environment_config(environment)
+    nft_config = config_manager.get_contract_config(environment, 'nft')
+    token_config = config_manager.get_contract_config(environment, 'kliver_tokens_core')
+    registry_config = config_manager.get_contract_config(environment, 'registry')
+    enabled = config_manager.get_enabled_contracts(environment)
+
+    # One `scarb build` produces every artifact; later deploy_full_flow calls reuse it
+    sierra_files = [config_manager.get_contract_config(environment, name).sierra_file for name in enabled]
+    if not no_compile and not ContractDeployer.compile_workspace_once(sierra_files):
+        click.echo(ERROR_TPL.format("\n✗ Compilation failed. Aborting."))
+        return False
+
+    # Steps 1-2: NFT and TokenSimulation have no dependency on each other, so deploy them in parallel
+    click.echo(f"{Colors.BOLD}Steps 1-2/5: Deploying NFT and TokenSimulation Contracts (in parallel){Colors.RESET}")
     nft_deployer = ContractDeployer(environment, 'nft', config_manager)
+    token_deployer = nft_deployer.for_contract('kliver_tokens_core')
 
-    # Get base_uri from config
-    contract_config = config_manager.get_contract_config(environment, 'nft')
-    nft_result = nft_deployer.deploy_full_flow(owner, no_compile=no_compile, base_uri=contract_config.base_uri)
+    nft_result, token_result = run_in_parallel(
+        lambda: nft_deployer.deploy_full_flow(owner, no_compile=no_compile, reuse_existing=reuse, base_uri=nft_config.base_uri),
+        lambda: token_deployer.deploy_full_flow(owner, no_compile=no_compile, reuse_existing=reuse, base_uri=token_config.base_uri),
+    )
 
     if nft_result:
         deployments.append(nft_result)
         deployed_addresses['nft'] = nft_result['contract_address']
-        click.echo(f"\n{Colors.SUCCESS}✓ NFT deployed successfully at: {deployed_addresses['nft']}{Colors.RESET}\n")
+        click.echo(SUCCESS_TPL.format(f"\n✓ NFT deployed successfully at: {deployed_addresses['nft']}\n"))
     else:
-        click.echo(f"\n{Colors.ERROR}✗ NFT deployment failed. Aborting.{Colors.RESET}")
+        click.echo(ERROR_TPL.format("\n✗ NFT deployment failed. Aborting."))
         return False
 
-    # Step 2: Deploy TokenSimulation
-    click.echo(f"{Colors.BOLD}Step 2/5: Deploying TokenSimulation Contract{Colors.RESET}")
-    token_deployer = ContractDeployer(environment, 'kliver_tokens_core', config_manager)
-
-    # Get base_uri from config
-    token_config = config_manager.get_contract_config(environment, 'kliver_tokens_core')
-    token_result = token_deployer.deploy_full_flow(owner, no_compile=no_compile, base_uri=token_config.base_uri)
-
     if token_result:
         deployments.append(token_result)
         deployed_addresses['token'] = token_result['contract_address']
-        click.echo(f"\n{Colors.SUCCESS}✓ TokenSimulation deployed successfully at: {deployed_addresses['token']}{Colors.RESET}\n")
+        click.echo(SUCCESS_TPL.format(f"\n✓ TokenSimulation deployed successfully at: {deployed_addresses['token']}\n"))
     else:
-        click.echo(f"\n{Colors.ERROR}✗ TokenSimulation deployment failed. Aborting.{Colors.RESET}")
+        click.echo(ERROR_TPL.format("\n✗ TokenSimulation deployment failed. Aborting."))
         return False
 
     # Step 3: Deploy Registry
     click.echo(f"{Colors.BOLD}Step 3/5: Deploying Registry Contract{Colors.RESET}")
-    registry_deployer = ContractDeployer(environment, 'registry', config_manager)
+    registry_deployer = nft_deployer.for_contract('registry')
+    pox_deployer = nft_deployer.for_contract('kliver_pox')
 
     # Get verifier_address from config if not provided
-    if not verifier_address:
-        registry_config = config_manager.get_contract_config(environment, 'registry')
-        verifier_address = registry_config.verifier_address or "0x0"
-
-    registry_result = registry_deployer.deploy_full_flow(
-        owner,
-        no_compile=no_compile,
-        nft_address=deployed_addresses['nft'],
-        token_simulation_address=deployed_addresses['token'],
-        verifier_address=verifier_address
+    verifier_address = opts.verifier_address or registry_config.verifier_address or "0x0"
+
+    # Declaring the KliverPox class doesn't need the Registry, so it is sent
+    # while the Registry deployment confirms; step 4 then reuses the class hash.
+    registry_result, _ = run_in_parallel(
+        lambda: registry_deployer.deploy_full_flow(
+            owner,
+            no_compile=no_compile, reuse_existing=reuse,
+            nft_address=deployed_addresses['nft'],
+            token_simulation_address=deployed_addresses['token'],
+            verifier_address=verifier_address
+        ),
+        pox_deployer.declare_contract,
     )
 
     if registry_result:
         deployments.append(registry_result)
         deployed_addresses['registry'] = registry_result['contract_address']
-        click.echo(f"\n{Colors.SUCCESS}✓ Registry deployed successfully at: {deployed_addresses['registry']}{Colors.RESET}\n")
+        click.echo(SUCCESS_TPL.format(f"\n✓ Registry deployed successfully at: {deployed_addresses['registry']}\n"))
     else:
-        click.echo(f"\n{Colors.ERROR}✗ Registry deployment failed. Aborting.{Colors.RESET}")
+        click.echo(ERROR_TPL.format("\n✗ Registry deployment failed. Aborting."))
         return False
 
     # Step 4: Deploy KliverPox and set in Registry
     click.echo(f"{Colors.BOLD}Step 4/5: Deploying KliverPox Contract{Colors.RESET}")
-    pox_deployer = ContractDeployer(environment, 'kliver_pox', config_manager)
-    pox_result = pox_deployer.deploy_full_flow(owner, no_compile=no_compile, registry_address=deployed_addresses['registry'])
+    pox_result = pox_deployer.deploy_full_flow(owner, no_compile=no_compile, reuse_existing=reuse, registry_address=deployed_addresses['registry'])
     if pox_result:
         deployments.append(pox_result)
         deployed_addresses['pox'] = pox_result['contract_address']
-        click.echo(f"\n{Colors.SUCCESS}✓ KliverPox deployed successfully at: {deployed_addresses['pox']}{Colors.RESET}\n")
-        # Set KliverPox in Registry
-        click.echo(f"{Colors.INFO}🔗 Setting KliverPox address in Registry...{Colors.RESET}")
-        from kliver_deploy.utils import CommandRunner
-        env_cfg = config_manager.get_environment_config(environment)
-
-        if env_cfg.network in ("mainnet", "sepolia"):
-            base_cmd = [
-                "sncast", "--account", env_cfg.account,
-                "invoke", "--network", env_cfg.network,
-                "--contract-address", deployed_addresses['registry'],
-                "--function", "set_kliver_pox_address",
-                "--calldata", deployed_addresses['pox'],
-            ]
-        else:
-            base_cmd = [
-                "sncast", "--profile", env_cfg.network,
-                "invoke",
-                "--contract-address", deployed_addresses['registry'],
-                "--function", "set_kliver_pox_address",
-                "--calldata", deployed_addresses['pox'],
-            ]
-
-        set_pox = CommandRunner.run_command(base_cmd, "Setting KliverPox in Registry")
-
-        # CRITICAL: Wait for the set_kliver_pox_address transaction to be confirmed before proceeding
-        if set_pox["success"]:
-            try:
-                from kliver_deploy.utils import StarknetUtils
-                tx_hash = StarknetUtils.parse_transaction_hash(set_pox["stdout"])
-                click.echo(f"{Colors.INFO}⏳ Waiting for set_kliver_pox_address transaction to be confirmed...{Colors.RESET}")
-                from kliver_deploy.utils import TransactionWaiter
-                tx_waiter = TransactionWaiter(env_cfg.account, env_cfg.rpc_url, env_cfg.network)
-                if not tx_waiter.wait_for_confirmation(tx_hash):
-                    click.echo(f"{Colors.ERROR}✗ set_kliver_pox_address transaction not confirmed. Aborting.{Colors.RESET}")
-                    return False
-                click.echo(f"{Colors.SUCCESS}✓ set_kliver_pox_address transaction confirmed{Colors.RESET}")
-            except ValueError as e:
-                click.echo(f"{Colors.WARNING}⚠️ Could not parse transaction hash from set_kliver_pox_address output: {str(e)}{Colors.RESET}")
-                # Continue anyway, might still work
-
-        # Verify get_kliver_pox_address
-        if set_pox["success"]:
-            if env_cfg.network in ("mainnet", "sepolia"):
-                base_verify = [
-                    "sncast", "--account", env_cfg.account,
-                    "call", "--network", env_cfg.network,
-                    "--contract-address", deployed_addresses['registry'],
-                    "--function", "get_kliver_pox_address",
-                ]
-            else:
-                base_verify = [
-                    "sncast", "--profile", env_cfg.network,
-                    "call",
-                    "--contract-address", deployed_addresses['registry'],
-                    "--function", "get_kliver_pox_address",
-                ]
-
-            verify = CommandRunner.run_command(base_verify, "Verifying KliverPox in Registry")
-            if verify["success"]:
-                try:
-                    from kliver_deploy.utils import StarknetUtils
-                    returned_address = StarknetUtils.parse_contract_address_from_call(verify["stdout"])
-                    # Normalize addresses for comparison (remove leading zeros)
-                    expected = deployed_addresses['pox'].lower().replace('0x', '').lstrip('0')
-                    returned = returned_address.lower().replace('0x', '').lstrip('0')
-                    if expected == returned:
-                        click.echo(f"{Colors.SUCCESS}✓ Verified KliverPox in Registry: {deployed_addresses['pox']}{Colors.RESET}")
-                    else:
-                        click.echo(f"{Colors.WARNING}⚠️ KliverPox address mismatch. Expected: {deployed_addresses['pox']}, Got: {returned_address}{Colors.RESET}")
-                except ValueError as e:
-                    click.echo(f"{Colors.WARNING}⚠️ Could not parse KliverPox address from output: {str(e)}{Colors.RESET}")
-            else:
-                click.echo(f"{Colors.WARNING}⚠️ Could not verify KliverPox address via get_kliver_pox_address{Colors.RESET}")
+        click.echo(SUCCESS_TPL.format(f"\n✓ KliverPox deployed successfully at: {deployed_addresses['pox']}\n"))
     else:
-        click.echo(f"\n{Colors.ERROR}✗ KliverPox deployment failed. Aborting.{Colors.RESET}")
+        click.echo(ERROR_TPL.format("\n✗ KliverPox deployment failed. Aborting."))
         return False
 
-    # Step 5: Configure TokenSimulation with Registry address
-    click.echo(f"{Colors.BOLD}Step 5/5: Configuring TokenSimulation with Registry address{Colors.RESET}")
-    click.echo(f"{Colors.INFO}Setting registry address on TokenSimulation contract...{Colors.RESET}")
-
-    # Call set_registry_address on the TokenSimulation contract
-    set_registry_result = token_deployer.set_registry_on_tokencore(
-        deployed_addresses['token'],
-        deployed_addresses['registry'],
-        owner
+    # Step 5: Wire KliverPox into Registry and Registry into TokenSimulation.
+    # Both setters go out as one multicall transaction (one fee, one
+    # confirmation wait) and are read back together afterwards.
+    click.echo(f"{Colors.BOLD}Step 5/5: Wiring KliverPox into Registry and Registry into TokenSimulation{Colors.RESET}")
+    wiring = token_deployer.invoke_setters_batch(
+        [
+            (deployed_addresses['registry'], "set_kliver_pox_address", [deployed_addresses['pox']]),
+            (deployed_addresses['token'], "set_registry_address", [deployed_addresses['registry']]),
+        ],
+        "Setting KliverPox in Registry and Registry in TokenSimulation",
     )
+    if not wiring:
+        click.echo(ERROR_TPL.format("\n✗ Failed to wire KliverPox and TokenSimulation. Aborting."))
+        return False
+    if not wiring[0].get("validation"):
+        click.echo(ERROR_TPL.format("\n✗ KliverPox address in Registry did not read back as set. Aborting."))
+        return False
 
-    if set_registry_result:
-        # Add post-deployment operation to the token deployment details
-        if token_result and 'post_deployment_ops' not in token_result:
-            token_result['post_deployment_ops'] = []
-        if token_result:
-            token_result['post_deployment_ops'].append(set_registry_result)
+    # Read-only wiring checks for later steps don't gate anything, so they are
+    # collected and run together at the end instead of one round-trip at a time
+    wiring_checks: List[Callable[[], bool]] = []
 
-        click.echo(f"\n{Colors.SUCCESS}✓ TokenSimulation configured with Registry address{Colors.RESET}\n")
+    token_wired = bool(wiring[1].get("validation"))
 
-        # Optionally deploy marketplaces if configured
-        # SessionMarketplace (simple)
-        try:
-            env_contracts = config_manager.load_config()["environments"][environment]["contracts"]
-        except Exception:
-            env_contracts = {}
+    if token_wired:
+        set_registry_result = wiring[1]
+        set_registry_result["params"] = {"registry_address": deployed_addresses['registry']}
+        set_registry_result["validation"] = "✓ Registry address validated"
 
-        if 'session_marketplace' in env_contracts:
+        # Add post-deployment operation to the token deployment details
+        token_result['post_deployment_ops'].append(set_registry_result)
+
+        click.echo(SUCCESS_TPL.format("\n✓ TokenSimulation configured with Registry address\n"))
+
+        # Optionally deploy marketplaces if configured. Both only depend on
+        # Registry/KliverPox, so they are deployed in parallel.
+        def deploy_simple_marketplace() -> Optional[Dict[str, Any]]:
             click.echo(f"\n{Colors.BOLD}Step 5: Deploying SessionMarketplace (simple){Colors.RESET}")
-            sm_deployer = ContractDeployer(environment, 'session_marketplace', config_manager)
-            sm_result = sm_deployer.deploy_full_flow(owner, no_compile=no_compile,
+            sm_deployer = nft_deployer.for_contract('session_marketplace')
+            sm_result = sm_deployer.deploy_full_flow(owner, no_compile=no_compile, reuse_existing=reuse,
                                                      registry_address=deployed_addresses['registry'])
             if sm_result:
-                deployments.append(sm_result)
-                deployed_addresses['session_marketplace'] = sm_result['contract_address']
-                click.echo(f"{Colors.SUCCESS}✓ SessionMarketplace deployed at: {sm_result['contract_address']}{Colors.RESET}")
+                click.echo(SUCCESS_TPL.format(f"✓ SessionMarketplace deployed at: {sm_result['contract_address']}"))
             else:
-                click.echo(f"{Colors.ERROR}✗ SessionMarketplace deployment failed (skipping).{Colors.RESET}")
+                click.echo(ERROR_TPL.format("✗ SessionMarketplace deployment failed (skipping)."))
+            return sm_result
 
-        if 'sessions_marketplace' in env_contracts:
+        def deploy_advanced_marketplace() -> Optional[Dict[str, Any]]:
             click.echo(f"\n{Colors.BOLD}Step 6: Deploying SessionsMarketplace (advanced){Colors.RESET}")
             adv_conf = config_manager.get_contract_config(environment, 'sessions_marketplace')
-            adv_deployer = ContractDeployer(environment, 'sessions_marketplace', config_manager)
+            adv_deployer = nft_deployer.for_contract('sessions_marketplace')
             # Resolve addresses and params
-            pay_token = payment_token_address or adv_conf.payment_token_address
-            timeout_s = purchase_timeout or adv_conf.purchase_timeout_seconds
+            pay_token = opts.payment_token_address or adv_conf.payment_token_address
+            timeout_s = opts.purchase_timeout or adv_conf.purchase_timeout_seconds
             # SessionsMarketplace now requires registry_address instead of verifier_address
             reg_addr = deployed_addresses.get('registry')
             if not (deployed_addresses.get('pox') and reg_addr and pay_token and timeout_s):
                 click.echo(f"{Colors.WARNING}⚠️  Missing PoX, Registry, token or timeout for SessionsMarketplace. Skipping.{Colors.RESET}")
+                return None
+            adv_result = adv_deployer.deploy_full_flow(owner, no_compile=no_compile, reuse_existing=reuse,
+                                                       pox_address=deployed_addresses['pox'],
+                                                       registry_address=reg_addr,
+                                                       payment_token_address=pay_token,
+                                                       purchase_timeout_seconds=timeout_s)
+            if adv_result:
+                click.echo(SUCCESS_TPL.format(f"✓ SessionsMarketplace deployed at: {adv_result['contract_address']}"))
             else:
-                adv_result = adv_deployer.deploy_full_flow(owner, no_compile=no_compile,
-                                                           pox_address=deployed_addresses['pox'],
-                                                           registry_address=reg_addr,
-                                                           payment_token_address=pay_token,
-                                                           purchase_timeout_seconds=timeout_s)
-                if adv_result:
-                    deployments.append(adv_result)
-                    deployed_addresses['sessions_marketplace'] = adv_result['contract_address']
-                    click.echo(f"{Colors.SUCCESS}✓ SessionsMarketplace deployed at: {adv_result['contract_address']}{Colors.RESET}")
-                    # Verify pox address wiring
-                    if env_cfg.network in ("mainnet", "sepolia"):
-                        base_sm = [
-                            "sncast", "--account", env_cfg.account,
-                            "call", "--network", env_cfg.network,
-                            "--contract-address", deployed_addresses['sessions_marketplace'],
-                            "--function", "get_pox_address",
-                        ]
-                    else:
-                        base_sm = [
-                            "sncast", "--profile", env_cfg.network,
-                            "call",
-                            "--contract-address", deployed_addresses['sessions_marketplace'],
-                            "--function", "get_pox_address",
-                        ]
-
-                    verify_sm = CommandRunner.run_command(base_sm, "Verifying SessionsMarketplace PoX wiring")
-                    if verify_sm["success"]:
-                        try:
-                            from kliver_deploy.utils import StarknetUtils
-                            returned_address = StarknetUtils.parse_contract_address_from_call(verify_sm["stdout"])
-                            # Normalize addresses for comparison (remove leading zeros)
-                            expected = deployed_addresses['pox'].lower().replace('0x', '').lstrip('0')
-                            returned = returned_address.lower().replace('0x', '').lstrip('0')
-                            if expected == returned:
-                                click.echo(f"{Colors.SUCCESS}✓ Verified SessionsMarketplace uses PoX: {deployed_addresses['pox']}{Colors.RESET}")
-                            else:
-                                click.echo(f"{Colors.WARNING}⚠️ SessionsMarketplace PoX address mismatch. Expected: {deployed_addresses['pox']}, Got: {returned_address}{Colors.RESET}")
-                        except ValueError as e:
-                            click.echo(f"{Colors.WARNING}⚠️ Could not parse PoX address from output: {str(e)}{Colors.RESET}")
-                    else:
-                        click.echo(f"{Colors.WARNING}⚠️ Could not verify SessionsMarketplace PoX wiring via get_pox_address{Colors.RESET}")
-                else:
-                    click.echo(f"{Colors.ERROR}✗ SessionsMarketplace deployment failed (skipping).{Colors.RESET}")
+                click.echo(ERROR_TPL.format("✗ SessionsMarketplace deployment failed (skipping)."))
+            return adv_result
+
+        marketplaces = [
+            (key, deploy_fn)
+            for key, deploy_fn in (('session_marketplace', deploy_simple_marketplace),
+                                   ('sessions_marketplace', deploy_advanced_marketplace))
+            if key in enabled
+        ]
+        marketplace_results = run_in_parallel(*(deploy_fn for _, deploy_fn in marketplaces))
+
+        for (key, _), result in zip(marketplaces, marketplace_results):
+            if result:
+                deployments.append(result)
+                deployed_addresses[key] = result['contract_address']
+
+        if deployed_addresses.get('sessions_marketplace'):
+            wiring_checks.append(
+                lambda: verify_address_wiring(env_cfg, deployed_addresses['sessions_marketplace'], "get_pox_address",
+                                              deployed_addresses['pox'], "PoX in SessionsMarketplace")
+            )
 
+        if wiring_checks:
+            click.echo(f"\n{Colors.BOLD}Verifying contract wiring...{Colors.RESET}")
+            run_in_parallel(*wiring_checks)
         return True
     else:
-        click.echo(f"\n{Colors.ERROR}✗ Failed to configure TokenSimulation with Registry address{Colors.RESET}")
+        click.echo(ERROR_TPL.format("\n✗ Failed to configure TokenSimulation with Registry address"))
         return False
 
 
-def deploy_single_contract(config_manager: ConfigManager, environment: str,
-                          contract: str, owner: Optional[str],
-                          nft_address: Optional[str], token_simulation_address: Optional[str],
-                          registry_address: Optional[str], pox_address: Optional[str], verifier_address: Optional[str],
-                          deployments: List[Dict[str, Any]], no_compile: bool = False,
-                          payment_token_address: Optional[str] = None, purchase_timeout: Optional[int] = None) -> bool:
+def deploy_single_contract(config_manager: "ConfigManager", opts: DeployOptions,
+                           deployments: List[Dict[str, Any]]) -> bool:
     """Deploy a single contract."""
-    
+    from kliver_deploy.deployer import ContractDeployer
+
+    environment, contract = opts.environment, opts.contract
+    nft_address, token_simulation_address = opts.nft_address, opts.token_simulation_address
+    registry_address, pox_address = opts.registry_address, opts.pox_address
+    verifier_address = opts.verifier_address
+    payment_token_address, purchase_timeout = opts.payment_token_address, opts.purchase_timeout
+
     deployer = ContractDeployer(environment, contract, config_manager)
     
     # Prepare deployment parameters based on contract type
@@ -476,14 +540,12 @@ def deploy_single_contract(config_manager: ConfigManager, environment: str,
         
     elif contract == 'registry':
         if not nft_address:
-            click.echo(f"\n{Colors.ERROR}❌ NFT address is required when deploying Registry separately{Colors.RESET}")
-            click.echo(f"{Colors.INFO}Use: --nft-address 0x... or deploy with --contract all{Colors.RESET}\n")
-            return False
+            raise DeployError("NFT address is required when deploying Registry separately",
+                              hint="Use: --nft-address 0x... or deploy with --contract all")
 
         if not token_simulation_address:
-            click.echo(f"\n{Colors.ERROR}❌ TokenSimulation address is required when deploying Registry separately{Colors.RESET}")
-            click.echo(f"{Colors.INFO}Use: --token-simulation-address 0x... or deploy with --contract all{Colors.RESET}\n")
-            return False
+            raise DeployError("TokenSimulation address is required when deploying Registry separately",
+                              hint="Use: --token-simulation-address 0x... or deploy with --contract all")
 
         click.echo(f"\n{Colors.BOLD}🎯 SEPARATE REGISTRY DEPLOYMENT{Colors.RESET}")
         click.echo(f"{Colors.INFO}Using NFT contract at: {nft_address}{Colors.RESET}")
@@ -503,8 +565,7 @@ def deploy_single_contract(config_manager: ConfigManager, environment: str,
     elif contract == 'session_marketplace':
         click.echo(f"\n{Colors.BOLD}🎯 SESSION MARKETPLACE DEPLOYMENT{Colors.RESET}\n")
         if not registry_address:
-            click.echo(f"{Colors.ERROR}❌ Registry address is required --registry-address 0x...{Colors.RESET}")
-            return False
+            raise DeployError("Registry address is required --registry-address 0x...")
         deploy_kwargs['registry_address'] = registry_address
     elif contract == 'simple_erc20':
         click.echo(f"\n{Colors.BOLD}🎯 SIMPLE ERC20 DEPLOYMENT{Colors.RESET}\n")
@@ -527,16 +588,16 @@ def deploy_single_contract(config_manager: ConfigManager, environment: str,
                 click.echo(f"{Colors.WARNING}⚠️  No --registry-address provided and none found in config. SessionsMarketplace requires Registry address.{Colors.RESET}")
 
         if not (pox_address and payment_token_address and purchase_timeout and actual_registry_address):
-            click.echo(f"{Colors.ERROR}❌ Missing required parameters for SessionsMarketplace deployment:{Colors.RESET}")
+            missing = ["Missing required parameters for SessionsMarketplace deployment:"]
             if not pox_address:
-                click.echo(f"{Colors.ERROR}  --pox-address <address> is required (KliverPox contract address){Colors.RESET}")
+                missing.append("  --pox-address <address> is required (KliverPox contract address)")
             if not actual_registry_address:
-                click.echo(f"{Colors.ERROR}  --registry-address <address> is required (Registry contract address){Colors.RESET}")
+                missing.append("  --registry-address <address> is required (Registry contract address)")
             if not payment_token_address:
-                click.echo(f"{Colors.ERROR}  --payment-token-address <address> is required{Colors.RESET}")
+                missing.append("  --payment-token-address <address> is required")
             if not purchase_timeout:
-                click.echo(f"{Colors.ERROR}  --purchase-timeout <seconds> is required{Colors.RESET}")
-            return False
+                missing.append("  --purchase-timeout <seconds> is required")
+            raise DeployError("\n".join(missing))
 
         # Set the parameters for deployment
         deploy_kwargs['pox_address'] = pox_address
@@ -545,7 +606,8 @@ def deploy_single_contract(config_manager: ConfigManager, environment: str,
         deploy_kwargs['purchase_timeout_seconds'] = purchase_timeout
 
     # Deploy the contract
-    result = deployer.deploy_full_flow(owner, no_compile=no_compile, **deploy_kwargs)
+    result = deployer.deploy_full_flow(opts.owner, no_compile=opts.no_compile,
+                                      reuse_existing=opts.reuse_deployments, **deploy_kwargs)
     
     if result:
         deployments.append(result)
@@ -2,14 +2,301 @@
 Main deployment orchestrator for Kliver contracts.
 """
 
+import copy
+import hashlib
 import json
+import os
+import re
+import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Any, Iterable, List, Set, Tuple
 
 from .config import ConfigManager, NetworkConfig, ContractConfig, DeploymentSettings
 from .contracts import get_contract, BaseContract
-from .utils import CommandRunner, StarknetUtils, TransactionWaiter, Colors, format_address
+from .utils import (
+    CommandRunner, StarknetUtils, TransactionWaiter, Colors, format_address, find_project_root, run_in_parallel,
+    dumps_indented_bytes, sncast_command, canon,
+)
+
+# Line template for each _log() level, colors baked in once
+_LOG_TEMPLATES = MappingProxyType({
+    level: f"{color}{{}}{Colors.RESET}\n"
+    for level, color in (
+        ("info", Colors.INFO),
+        ("success", Colors.SUCCESS),
+        ("warning", Colors.WARNING),
+        ("error", Colors.ERROR),
+        ("bold", Colors.BOLD),
+    )
+})
+
+# Templates for the per-item lines of the deployment summary
+_SUMMARY_PARAM_CYAN = f"  {{}}: {Colors.CYAN}{{}}{Colors.RESET}"
+_SUMMARY_PARAM_INFO = f"  {{}}: {Colors.INFO}{{}}{Colors.RESET}"
+_SUMMARY_OP = f"  {{}}. {Colors.BOLD}{{}}(){Colors.RESET}"
+_SUMMARY_OP_TX = f"     Transaction: {Colors.INFO}{{}}{Colors.RESET}"
+_SUMMARY_OP_VALIDATION = f"     Validation: {Colors.SUCCESS}{{}}{Colors.RESET}"
+
+
+def _log(level: str, message: str) -> None:
+    """Write one colored status line with a single stdout write."""
+    sys.stdout.write(_LOG_TEMPLATES[level].format(message))
+
+
+# sncast error for a class that is already declared, compiled once
+_ALREADY_DECLARED_RE = re.compile(r"Class with hash (0x[a-fA-F0-9]+) is already declared")
+
+
+def _felt(value: str) -> Optional[int]:
+    """A hex or decimal felt as an int, or None if it isn't one."""
+    try:
+        return int(value, 0)
+    except ValueError:
+        return None
+
+
+def _line_scanner(parsers: Dict[str, Callable[[str], str]], found: Dict[str, str]) -> Callable[[str], bool]:
+    """
+    on_line callback for CommandRunner.run_command_stream that fills `found`
+    with the first value each parser extracts; done once every key is found.
+    """
+    def scan(line: str) -> bool:
+        for key, parse in parsers.items():
+            if key not in found:
+                try:
+                    found[key] = parse(line)
+                except ValueError:
+                    pass
+        return len(found) == len(parsers)
+
+    return scan
+
+
+# sn_keccak("RegistryAddressUpdated"), keys[0] of the event TokenSimulation emits
+# from set_registry_address. Fixed by the event name; the stdlib has no keccak.
+_REGISTRY_ADDRESS_UPDATED_SELECTOR = 0x7caee99e5d38b3d16cadf0f5ccc74e2f40503d97260eec958eff22ed4b042c
+
+
+# View function called to check that an address holds a contract of each type
+_VALIDATION_FUNCTIONS = MappingProxyType({
+    "nft": "name",           # ERC721
+    "registry": "get_owner",  # Registry specific
+    "token": "balance_of",  # ERC1155
+    "token_simulation": "balance_of",  # ERC1155 (TokenSimulation)
+    "pox": "get_registry_address",  # KliverPox - validates it has registry
+    "verifier": None,  # TODO: Add verifier validation once we know the interface
+    "payment_token": "total_supply",  # ERC20 - validates it's a token contract
+})
+_VALIDATION_CALLDATA = MappingProxyType({
+    "balance_of": ("0x0", "0x1"),  # dummy address and token id for ERC1155
+})
+
+
+@lru_cache(maxsize=16)
+def _account_address_re(account: str) -> "re.Pattern[str]":
+    """Pattern for an account's address in `sncast account list` output."""
+    return re.compile(rf"{re.escape(account)}:.*?address: (0x[a-fA-F0-9]+)", re.DOTALL)
+
+
+# Deployers running in parallel share one account, so transactions are
+# submitted one at a time; only the confirmation waits overlap.
+_submission_lock = threading.Lock()
+
+# Class hashes declared (or found already declared) during this process,
+# keyed by (network, contract name, sha256 of the compiled Sierra artifact).
+_declared_classes: Dict[Tuple[str, str, str], str] = {}
+
+# Declared class hashes also persist across runs, one JSON file per network.
+# Only public networks are cached on disk: local devnets get restarted and
+# forget their classes, so a stale entry there would break the deploy.
+CLASS_HASH_CACHE_DIR = Path.home() / ".cache" / "kliver_deploy" / "class_hashes"
+_PERSISTENT_NETWORKS = ("mainnet", "sepolia")
+_loaded_class_caches: Set[str] = set()
+_class_cache_lock = threading.Lock()
+
+
+def _load_class_hash_cache(network: str) -> None:
+    """Merge the on-disk class hashes for `network` into the in-process memo."""
+    with _class_cache_lock:
+        if network in _loaded_class_caches or network not in _PERSISTENT_NETWORKS:
+            return
+        _loaded_class_caches.add(network)
+        try:
+            entries = json.loads((CLASS_HASH_CACHE_DIR / f"{network}.json").read_text())
+        except (OSError, ValueError):
+            return
+        for entry_key, class_hash in entries.items():
+            name, _, digest = entry_key.rpartition(":")
+            _declared_classes.setdefault((network, name, digest), class_hash)
+
+
+def _store_class_hash(cache_key: Tuple[str, str, str], class_hash: str) -> None:
+    """Record a declared class hash in memory and, for public networks, on disk."""
+    network = cache_key[0]
+    with _class_cache_lock:
+        _declared_classes[cache_key] = class_hash
+        if network not in _PERSISTENT_NETWORKS:
+            return
+        entries = {
+            f"{name}:{digest}": known_hash
+            for (net, name, digest), known_hash in _declared_classes.items()
+            if net == network
+        }
+        cache_file = CLASS_HASH_CACHE_DIR / f"{network}.json"
+        try:
+            CLASS_HASH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(dumps_indented_bytes(entries))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            _log("warning", f"⚠️ Could not write class hash cache {cache_file}: {e}")
+
+
+# Dependency contracts that passed validate_contract, as {"<type>:<address>":
+# time of the check} per network. Public networks persist the entries on disk
+# like the class hash cache; a check older than the environment's
+# validation_cache_ttl (seconds, 0 disables) is done again.
+VALIDATION_CACHE_DIR = Path.home() / ".cache" / "kliver_deploy" / "validations"
+_validated_contracts: Dict[str, Dict[str, float]] = {}
+_validation_cache_lock = threading.Lock()
+
+
+def _validation_entries(network: str) -> Dict[str, float]:
+    """Validation times for `network`, read from disk on first use (caller holds the lock)."""
+    entries = _validated_contracts.get(network)
+    if entries is None:
+        entries = {}
+        if network in _PERSISTENT_NETWORKS:
+            try:
+                loaded = json.loads((VALIDATION_CACHE_DIR / f"{network}.json").read_text())
+                if isinstance(loaded, dict):
+                    entries.update(loaded)
+            except (OSError, ValueError):
+                pass
+        _validated_contracts[network] = entries
+    return entries
+
+
+def _validated_recently(network: str, key: str, ttl: float) -> bool:
+    """Whether `key` passed validation on `network` less than `ttl` seconds ago."""
+    with _validation_cache_lock:
+        checked_at = _validation_entries(network).get(key)
+    return checked_at is not None and time.time() - checked_at < ttl
+
+
+def _record_validation(network: str, key: str) -> None:
+    """Remember a successful validation in memory and, for public networks, on disk."""
+    with _validation_cache_lock:
+        entries = _validation_entries(network)
+        entries[key] = time.time()
+        if network not in _PERSISTENT_NETWORKS:
+            return
+        cache_file = VALIDATION_CACHE_DIR / f"{network}.json"
+        try:
+            VALIDATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(dumps_indented_bytes(entries))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            _log("warning", f"⚠️ Could not write validation cache {cache_file}: {e}")
+
+
+# `sncast account list` output by project root (sncast runs from there). The
+# list doesn't change during a run, so every deployer in the process shares it.
+_account_lists: Dict[Path, Dict[str, Any]] = {}
+_account_list_lock = threading.Lock()
+
+# Project roots whose prerequisite checks passed during this process. Tool and
+# account availability doesn't change mid-run, so later deployers skip them.
+_checked_prerequisites: Set[Path] = set()
+_prerequisites_lock = threading.Lock()
+
+# Workspaces already built by `scarb build` during this process. One build
+# produces the artifacts for every contract, so it only has to run once.
+_compiled_workspaces: Set[Path] = set()
+_compile_lock = threading.Lock()
+
+
+# Fingerprint of the sources that produced the artifacts in target/, written
+# after each successful `scarb build` so unchanged workspaces aren't rebuilt.
+# It only stats the files: any edit (or touch) changes mtime and triggers a build.
+BUILD_FINGERPRINT_FILE = "target/.kliver_build_fingerprint"
+
+
+def _source_fingerprint(project_root: Path) -> str:
+    """blake2b over the path, mtime and size of each Cairo source and Scarb manifest."""
+    digest = hashlib.blake2b(digest_size=16)
+    sources = sorted(project_root.glob("src/**/*.cairo"))
+    for path in [*sources, project_root / "Scarb.toml", project_root / "Scarb.lock"]:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.relative_to(project_root)}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+# Deployment info files are written off the critical path; deploy_full_flow
+# waits for its write before returning.
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kliver-io")
+
+
+def _write_file_atomic(path: Path, data: bytes) -> Path:
+    """
+    Write data through a temp file and os.replace, so readers never see a partial file.
+
+    The temp file is flushed and fsynced before the replace, so a crash can't
+    leave a truncated file in place of the old one.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)  # buffered write: loops until every byte is written
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_json_atomic(path: Path, data: Any) -> Path:
+    """Serialize data as indented JSON and write it atomically."""
+    return _write_file_atomic(path, dumps_indented_bytes(data))
+
+
+# Records of finished deployments, one JSON file per
+# <environment>/<contract type>/<fingerprint>, where the fingerprint covers the
+# compiled artifact, the owner, the constructor arguments and the network.
+# Only written by runs with reuse_existing set; the directory is git-ignored.
+DEPLOYMENT_RECORDS_DIR = "deployments"
+
+
+@dataclass(frozen=True)
+class _ClassifiedKwargs:
+    """Contract kwargs sorted by role in a single pass over them."""
+    addresses: Dict[str, Any]           # *_address arguments that are set
+    dependencies: Dict[str, Any]        # the same, keyed by dependency type
+    constructor_params: Dict[str, Any]  # arguments shown as constructor parameters
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> "_ClassifiedKwargs":
+        addresses: Dict[str, Any] = {}
+        dependencies: Dict[str, Any] = {}
+        constructor_params: Dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key.endswith('_address'):
+                constructor_params[key] = value
+                if value:
+                    addresses[key] = value
+                    dependencies[key[:-len('_address')]] = value
+            elif key in ('base_uri', 'purchase_timeout_seconds'):
+                constructor_params[key] = value
+        return cls(addresses, dependencies, constructor_params)
 
 
 class ContractDeployer:
@@ -37,127 +324,297 @@ class ContractDeployer:
         self.contract = get_contract(contract_type)
         
         # Initialize transaction waiter
-        self.tx_waiter = TransactionWaiter(self.network_config.account, self.network_config.rpc_url, self.network_config.network)
+        self.tx_waiter = TransactionWaiter(
+            self.network_config.account,
+            self.network_config.rpc_url,
+            self.network_config.network,
+            max_wait=self.deployment_settings.wait_timeout,
+        )
+
+        self._account_address_re = _account_address_re(self.network_config.account)
+        self._deploy_info_skeleton = self._build_info_skeleton()
+
+    def _build_info_skeleton(self) -> Dict[str, Any]:
+        """The fields of the deployment info file that are fixed for this deployer."""
+        return {
+            "environment": self.environment,
+            "network": self.network_config.network,
+            "account": self.network_config.account,
+            "rpc_url": self.network_config.rpc_url,
+            "contract_name": self.contract_config.name,
+            "contract_type": self.contract_type,
+        }
+
+    def _build_sncast_cmd(self, verb: str, *extras: str) -> List[str]:
+        """sncast command line for this environment (see utils.sncast_command)."""
+        return sncast_command(self.network_config.account, self.network_config.network, verb, *extras)
+
+    def for_contract(self, contract_type: str) -> "ContractDeployer":
+        """Create a deployer for another contract in the same environment, sharing the network setup."""
+        deployer = copy.copy(self)
+        deployer.contract_type = contract_type
+        deployer.contract_config = self.config_manager.get_contract_config(self.environment, contract_type)
+        deployer.contract = get_contract(contract_type)
+        deployer._deploy_info_skeleton = deployer._build_info_skeleton()
+        return deployer
 
     def check_prerequisites(self) -> bool:
-        """Check if all required tools and configurations are available."""
-        print(f"{Colors.INFO}🔍 Checking prerequisites...{Colors.RESET}")
-        
+        """Check if all required tools and configurations are available (once per process)."""
+        workspace = find_project_root(Path.cwd())
+        with _prerequisites_lock:
+            if workspace in _checked_prerequisites:
+                return True
+            if not self._run_prerequisite_checks():
+                return False
+            _checked_prerequisites.add(workspace)
+            return True
+
+    def _run_prerequisite_checks(self) -> bool:
+        """Run the Scarb, Starknet Foundry and account checks."""
+        _log("info", "🔍 Checking prerequisites...")
+
+        # The three checks are independent, so they run concurrently
+        scarb, foundry, accounts = run_in_parallel(
+            partial(CommandRunner.run_command, ["scarb", "--version"], "Checking Scarb"),
+            partial(CommandRunner.run_command, ["sncast", "--version"], "Checking Starknet Foundry"),
+            self._account_list,
+        )
+
         # Check Scarb
-        result = CommandRunner.run_command(["scarb", "--version"], "Checking Scarb")
-        if not result["success"]:
-            print(f"{Colors.ERROR}✗ Scarb not found. Please install Scarb first.{Colors.RESET}")
+        if not scarb["success"]:
+            _log("error", "✗ Scarb not found. Please install Scarb first.")
             return False
         
         # Check Starknet Foundry
-        result = CommandRunner.run_command(["sncast", "--version"], "Checking Starknet Foundry")
-        if not result["success"]:
-            print(f"{Colors.ERROR}✗ Starknet Foundry not found. Please install Starknet Foundry first.{Colors.RESET}")
+        if not foundry["success"]:
+            _log("error", "✗ Starknet Foundry not found. Please install Starknet Foundry first.")
             return False
         
         # Check available accounts
-        result = CommandRunner.run_command(["sncast", "account", "list"], "Checking accounts")
-        if not result["success"]:
-            print(f"{Colors.ERROR}✗ Could not access accounts. Please check your Starknet configuration.{Colors.RESET}")
+        if not accounts["success"]:
+            _log("error", "✗ Could not access accounts. Please check your Starknet configuration.")
             return False
             
-        print(f"{Colors.SUCCESS}✓ Prerequisites OK{Colors.RESET}")
+        _log("success", "✓ Prerequisites OK")
         return True
 
+    @staticmethod
+    def _account_list() -> Dict[str, Any]:
+        """Result of `sncast account list`, fetched once per project and reused while it succeeds."""
+        project_root = find_project_root(Path.cwd())
+        with _account_list_lock:
+            result = _account_lists.get(project_root)
+            if result is None:
+                result = CommandRunner.run_command(["sncast", "account", "list"], "Checking accounts")
+                if result["success"]:
+                    _account_lists[project_root] = result
+        return result
+
+    @staticmethod
+    def reset() -> None:
+        """Forget cached account data and prerequisite results, e.g. after the sncast account store changed."""
+        with _account_list_lock:
+            _account_lists.clear()
+        with _prerequisites_lock:
+            _checked_prerequisites.clear()
+
+    def _submit_transaction(self, command: List[str], description: str,
+                            on_line: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Run a transaction-sending sncast command, retrying while the account nonce is taken.
+
+        With on_line the output is streamed through it (see CommandRunner.run_command_stream).
+        """
+        max_retries = self.deployment_settings.max_retries
+        for attempt in range(max_retries + 1):
+            with _submission_lock:
+                if on_line is None:
+                    result = CommandRunner.run_command(command, description)
+                else:
+                    result = CommandRunner.run_command_stream(command, description, on_line)
+
+            nonce_error = any("nonce" in result.get(stream, "").lower() for stream in ("stdout", "stderr"))
+            if result["success"] or not nonce_error or attempt == max_retries:
+                return result
+
+            retry_in = self.deployment_settings.retry_interval
+            _log("warning", f"⏳ Account nonce still in use by a pending transaction, retrying in {retry_in}s...")
+            time.sleep(retry_in)
+        return result
+
+    def _await_tx(self, tx_hash: str, label: str = "Transaction hash") -> bool:
+        """Report a submitted transaction and wait until the network confirms it."""
+        _log("info", f"📋 {label}: {tx_hash}")
+        return self.tx_waiter.wait_for_confirmation(tx_hash)
+
     def get_account_info(self) -> Optional[str]:
         """Get account information and return the account address."""
-        print(f"{Colors.BOLD}📋 Getting account information...{Colors.RESET}")
+        _log("bold", "📋 Getting account information...")
         
-        result = CommandRunner.run_command(["sncast", "account", "list"], "Retrieving account details")
+        result = self._account_list()
         if not result["success"]:
             return None
             
         # Parse account address from output
-        import re
-        account_pattern = rf"{self.network_config.account}:.*?address: (0x[a-fA-F0-9]+)"
-        match = re.search(account_pattern, result["stdout"], re.DOTALL)
+        match = self._account_address_re.search(result["stdout"])
         
         if match:
             address = match.group(1)
-            print(f"{Colors.SUCCESS}✓ Found account '{self.network_config.account}' with address: {address}{Colors.RESET}")
+            _log("success", f"✓ Found account '{self.network_config.account}' with address: {address}")
             return address
         else:
-            print(f"{Colors.ERROR}Could not parse address for account '{self.network_config.account}'{Colors.RESET}")
+            _log("error", f"Could not parse address for account '{self.network_config.account}'")
             return None
 
-    def compile_contract(self) -> bool:
-        """Compile the contract using Scarb."""
-        print(f"{Colors.INFO}🔨 Compiling contracts...{Colors.RESET}")
+    @staticmethod
+    def compile_contract(sierra_files: Iterable[str] = ()) -> bool:
+        """
+        Compile the contract using Scarb, unless the sources are unchanged since the last build.
+
+        The previous build is only reused while every artifact in sierra_files
+        (paths relative to the project root) is still on disk.
+        """
+        project_root = find_project_root(Path.cwd())
+        fingerprint = _source_fingerprint(project_root)
+        marker = project_root / BUILD_FINGERPRINT_FILE
+        artifacts = [project_root / sierra_file for sierra_file in sierra_files]
+        try:
+            # The marker alone isn't enough: the artifacts may have been removed since
+            built = bool(artifacts) and marker.read_text() == fingerprint and all(
+                artifact.is_file() for artifact in artifacts
+            )
+        except OSError:
+            built = False
+        if built:
+            _log("success", "♻️ Sources unchanged since last build, reusing compiled contracts")
+            return True
+
+        _log("info", "🔨 Compiling contracts...")
         
         result = CommandRunner.run_command(["scarb", "build"], "Compiling contracts")
         if result["success"]:
-            print(f"{Colors.SUCCESS}✓ Compilation successful{Colors.RESET}")
+            _log("success", "✓ Compilation successful")
+            try:
+                marker.write_text(fingerprint)
+            except OSError:
+                pass
+        elif result["stdout"].strip():
+            # Scarb prints compiler diagnostics on stdout, so show them on failure
+            sys.stdout.write(result["stdout"].rstrip() + "\n")
         return result["success"]
 
+    @staticmethod
+    def compile_workspace_once(sierra_files: Iterable[str] = ()) -> bool:
+        """Compile the Scarb workspace unless it was already built in this process (see compile_contract)."""
+        workspace = find_project_root(Path.cwd())
+        with _compile_lock:
+            if workspace in _compiled_workspaces:
+                _log("info", "⏭️ Contracts already compiled in this session")
+                return True
+            if not ContractDeployer.compile_contract(sierra_files):
+                return False
+            _compiled_workspaces.add(workspace)
+            return True
+
+    def _declare_cache_key(self) -> Optional[Tuple[str, str, str]]:
+        """Key identifying the compiled class, or None if the artifact is not on disk."""
+        artifact = find_project_root(Path.cwd()) / self.contract_config.sierra_file
+        try:
+            digest = hashlib.sha256(artifact.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        return (self.network_config.network, self.contract_config.name, digest)
+
     def declare_contract(self) -> Optional[str]:
         """Declare the contract and return the class hash."""
-        print(f"\n{Colors.BOLD}📤 Declaring contract...{Colors.RESET}")
-
-        def _net_flags() -> list[str]:
-            return ["--network", self.network_config.network] if self.network_config.network in ("mainnet", "sepolia") else []
+        class_hash, tx_hash = self.send_declaration()
+        if class_hash and tx_hash:
+            if not self._await_tx(tx_hash):
+                _log("error", "Declaration transaction not confirmed. Deployment may fail.")
+                return None
+            self.remember_class_hash(class_hash)
+        return class_hash
 
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "declare", "--network", self.network_config.network,
-                "--contract-name", self.contract_config.name,
-            ]
-        else:
-            # For local/katana networks, use profile instead of --url to get proper account resolution
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "declare",
-                "--contract-name", self.contract_config.name,
-            ]
-        
-        result = CommandRunner.run_command(command, f"Declaring {self.contract_config.name} to {self.network_config.network}")
+    def send_declaration(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Declare the contract without waiting for the transaction.
 
-        all_output = result.get("stdout", "") + result.get("stderr", "")
+        Returns (class hash, declare transaction hash). The transaction hash is
+        None when nothing was sent because the class is already declared; the
+        class hash is None if the declaration failed. Once the transaction is
+        confirmed, pass the class hash to remember_class_hash.
+        """
+        _log("bold", "\n📤 Declaring contract...")
+
+        _load_class_hash_cache(self.network_config.network)
+        cache_key = self._declare_cache_key()
+        if cache_key in _declared_classes:
+            class_hash = _declared_classes[cache_key]
+            _log("success", f"✓ Contract already declared with cached class hash: {class_hash}")
+            _log("info", "ℹ️  Skipping declaration, proceeding with deployment...")
+            return class_hash, None
+
+        class_hash, tx_hash = self._declare_class()
+        if class_hash and not tx_hash:
+            self.remember_class_hash(class_hash)
+        return class_hash, tx_hash
+
+    def remember_class_hash(self, class_hash: str) -> None:
+        """Cache a confirmed class hash for this contract's compiled artifact."""
+        cache_key = self._declare_cache_key()
+        if cache_key:
+            _store_class_hash(cache_key, class_hash)
+
+    def _declare_class(self) -> Tuple[Optional[str], Optional[str]]:
+        """Submit the declare transaction; (class hash, tx hash), either None if not found."""
+        network = self.network_config.network
+        name = self.contract_config.name
+
+        command = self._build_sncast_cmd(
+            "declare",
+            "--contract-name", name,
+        )
         
-        try:
-            # Try to parse class hash
-            class_hash = StarknetUtils.parse_class_hash(all_output)
-            print(f"{Colors.SUCCESS}✓ Contract declared with class hash: {class_hash}{Colors.RESET}")
-            
-            # Check for transaction hash and wait for confirmation
-            try:
-                tx_hash = StarknetUtils.parse_transaction_hash(all_output)
-                print(f"{Colors.INFO}📋 Transaction hash: {tx_hash}{Colors.RESET}")
-                
-                if not self.tx_waiter.wait_for_confirmation(tx_hash):
-                    print(f"{Colors.ERROR}Declaration transaction not confirmed. Deployment may fail.{Colors.RESET}")
-                    return None
-            except ValueError:
-                # No transaction hash found, might be already declared
-                pass
-            
-            return class_hash
-            
-        except ValueError:
-            # Check if it's "already declared" error
-            import re
-            already_declared_pattern = r"Class with hash (0x[a-fA-F0-9]+) is already declared"
-            match = re.search(already_declared_pattern, all_output)
-            
+        # Scan the output as it streams in; stop once both hashes (or the
+        # "already declared" error) have been seen
+        found: Dict[str, str] = {}
+        already_declared: List[str] = []
+
+        scan_hashes = _line_scanner({
+            "class_hash": StarknetUtils.parse_class_hash,
+            "tx_hash": StarknetUtils.parse_transaction_hash,
+        }, found)
+
+        def scan(line: str) -> bool:
+            match = _ALREADY_DECLARED_RE.search(line)
             if match:
-                class_hash = match.group(1)
-                print(f"{Colors.SUCCESS}✓ Contract already declared with class hash: {class_hash}{Colors.RESET}")
-                print(f"{Colors.INFO}ℹ️  Skipping declaration, proceeding with deployment...{Colors.RESET}")
-                return class_hash
-            
-            # Actual failure
-            print(f"{Colors.ERROR}Declaration failed{Colors.RESET}")
-            print(f"{Colors.ERROR}Error: {all_output}{Colors.RESET}")
-            return None
-
-    def deploy_contract(self, class_hash: str, owner_address: str, **kwargs) -> Optional[Dict[str, Any]]:
+                already_declared.append(match.group(1))
+            return scan_hashes(line) or bool(already_declared)
+
+        result = self._submit_transaction(command, f"Declaring {name} to {network}", on_line=scan)
+
+        class_hash = found.get("class_hash")
+        if class_hash:
+            _log("success", f"✓ Contract declared with class hash: {class_hash}")
+            # No transaction hash: might be already declared
+            return class_hash, found.get("tx_hash")
+
+        if already_declared:
+            class_hash = already_declared[0]
+            _log("success", f"✓ Contract already declared with class hash: {class_hash}")
+            _log("info", "ℹ️  Skipping declaration, proceeding with deployment...")
+            return class_hash, None
+
+        # Actual failure
+        _log("error", "Declaration failed")
+        _log("error", f"Error: {result['stdout']}")
+        return None, None
+
+    def deploy_contract(self, class_hash: str, owner_address: str, *,
+                        classified: Optional[_ClassifiedKwargs] = None, **kwargs) -> Optional[Dict[str, Any]]:
         """Deploy the contract and return deployment details."""
-        print(f"{Colors.INFO}🚀 Deploying {self.contract_config.name}...{Colors.RESET}")
+        name = self.contract_config.name
+        _log("info", f"🚀 Deploying {name}...")
 
         # Validate dependencies
         if not self.contract.validate_dependencies(**kwargs):
@@ -166,114 +623,101 @@ class ContractDeployer:
         # Get constructor calldata
         constructor_calldata = self.contract.get_constructor_calldata(owner_address, **kwargs)
 
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "deploy", "--network", self.network_config.network,
-                "--class-hash", class_hash,
-            ]
-            if constructor_calldata:  # Only add --constructor-calldata if there are parameters
-                command.extend(["--constructor-calldata"] + constructor_calldata)
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "deploy",
-                "--class-hash", class_hash,
-            ]
-            if constructor_calldata:  # Only add --constructor-calldata if there are parameters
-                command.extend(["--constructor-calldata"] + constructor_calldata)
+        # Only add --constructor-calldata if there are parameters
+        calldata_args = ("--constructor-calldata", *constructor_calldata) if constructor_calldata else ()
 
-        result = CommandRunner.run_command(command, f"Deploying {self.contract_config.name}")
+        command = self._build_sncast_cmd(
+            "deploy",
+            "--class-hash", class_hash,
+            *calldata_args,
+        )
+
+        # Pick the address and transaction hash out of the output as it streams in
+        found: Dict[str, str] = {}
+        scan = _line_scanner({
+            "contract_address": StarknetUtils.parse_contract_address,
+            "tx_hash": StarknetUtils.parse_transaction_hash,
+        }, found)
+        result = self._submit_transaction(command, f"Deploying {name}", on_line=scan)
 
         if not result["success"]:
-            print(f"{Colors.ERROR}Deployment command failed:{Colors.RESET}")
-            print(f"{Colors.ERROR}STDOUT: {result['stdout']}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDERR: {result['stderr']}{Colors.RESET}")
+            _log("error", "Deployment command failed:")
+            _log("error", f"Output: {result['stdout']}")
             return None
 
-        try:
-            contract_address = StarknetUtils.parse_contract_address(result["stdout"])
-            print(f"{Colors.SUCCESS}✓ Contract deployed at address: {contract_address}{Colors.RESET}")
-
-            deployment_tx_hash = None
-            # Wait for deployment transaction confirmation
-            try:
-                deployment_tx_hash = StarknetUtils.parse_transaction_hash(result["stdout"])
-                print(f"{Colors.INFO}📋 Deployment transaction hash: {deployment_tx_hash}{Colors.RESET}")
-
-                print(f"{Colors.BOLD}⏳ Waiting for deployment to be confirmed on the network...{Colors.RESET}")
-                if not self.tx_waiter.wait_for_confirmation(deployment_tx_hash):
-                    print(f"{Colors.ERROR}✗ Deployment transaction not confirmed. Contract may not be available yet.{Colors.RESET}")
-                    return None
-
-                print(f"{Colors.SUCCESS}✓ Contract deployment confirmed on L2!{Colors.RESET}")
+        contract_address = found.get("contract_address")
+        if not contract_address:
+            _log("error", "Could not parse contract address from deployment output")
+            _log("error", f"Output: {result['stdout']}")
+            return None
+        _log("success", f"✓ Contract deployed at address: {contract_address}")
 
-            except ValueError:
-                print(f"{Colors.WARNING}⚠️  No transaction hash found in deployment output{Colors.RESET}")
+        # Wait for deployment transaction confirmation
+        deployment_tx_hash = found.get("tx_hash")
+        if deployment_tx_hash:
+            if not self._await_tx(deployment_tx_hash, "Deployment transaction hash"):
+                _log("error", "✗ Deployment transaction not confirmed. Contract may not be available yet.")
+                return None
 
-            # Return deployment details
-            return {
-                "contract_address": contract_address,
-                "deployment_tx_hash": deployment_tx_hash,
-                "constructor_calldata": constructor_calldata,
-                "constructor_params": self._format_constructor_params(owner_address, **kwargs)
-            }
+            _log("success", "✓ Contract deployment confirmed on L2!")
+        else:
+            _log("warning", "⚠️  No transaction hash found in deployment output")
 
-        except ValueError as e:
-            print(f"{Colors.ERROR}Could not parse contract address from deployment output{Colors.RESET}")
-            print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDOUT: {result['stdout']}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDERR: {result['stderr']}{Colors.RESET}")
-            return None
+        # Return deployment details
+        return {
+            "contract_address": contract_address,
+            "deployment_tx_hash": deployment_tx_hash,
+            "constructor_calldata": constructor_calldata,
+            "constructor_params": self._format_constructor_params(
+                owner_address, classified or _ClassifiedKwargs.from_kwargs(kwargs)
+            )
+        }
 
     def set_registry_on_tokencore(self, tokencore_address: str, registry_address: str, owner_address: str) -> Optional[Dict[str, Any]]:
         """Set the registry address on the TokenSimulation contract."""
-        print(f"{Colors.INFO}🔗 Setting registry address on TokenSimulation contract...{Colors.RESET}")
-
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "invoke", "--network", self.network_config.network,
-                "--contract-address", tokencore_address,
-                "--function", "set_registry_address",
-                "--calldata", registry_address,
-            ]
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "invoke",
-                "--contract-address", tokencore_address,
-                "--function", "set_registry_address",
-                "--calldata", registry_address,
-            ]
+        _log("info", "🔗 Setting registry address on TokenSimulation contract...")
 
-        result = CommandRunner.run_command(command, f"Setting registry address on TokenSimulation")
+        command = self._build_sncast_cmd(
+            "invoke",
+            "--contract-address", tokencore_address,
+            "--function", "set_registry_address",
+            "--calldata", registry_address,
+        )
+
+        result = self._submit_transaction(command, f"Setting registry address on TokenSimulation")
 
         if not result["success"]:
-            print(f"{Colors.ERROR}Failed to set registry address on TokenSimulation:{Colors.RESET}")
-            print(f"{Colors.ERROR}STDOUT: {result['stdout']}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDERR: {result['stderr']}{Colors.RESET}")
+            _log("error", "Failed to set registry address on TokenSimulation:")
+            _log("error", f"STDOUT: {result['stdout']}")
+            _log("error", f"STDERR: {result['stderr']}")
             return None
 
         try:
-            # Debug: print the output to see what we're parsing
-            print(f"{Colors.INFO}DEBUG - Command output:{Colors.RESET}")
-            print(f"STDOUT: {result['stdout']}")
-            print(f"STDERR: {result['stderr']}")
+            if self.deployment_settings.debug:
+                _log("info", "DEBUG - Command output:")
+                _log("info", f"STDOUT: {result['stdout']}")
+                _log("info", f"STDERR: {result['stderr']}")
 
             tx_hash = StarknetUtils.parse_transaction_hash(result["stdout"])
-            print(f"{Colors.INFO}📋 Transaction hash: {tx_hash}{Colors.RESET}")
-
-            print(f"{Colors.BOLD}⏳ Waiting for transaction to be confirmed...{Colors.RESET}")
-            if not self.tx_waiter.wait_for_confirmation(tx_hash):
-                print(f"{Colors.ERROR}✗ Transaction not confirmed.{Colors.RESET}")
+            if not self._await_tx(tx_hash):
+                _log("error", "✗ Transaction not confirmed.")
                 return None
 
-            print(f"{Colors.SUCCESS}✓ Registry address set successfully on TokenSimulation!{Colors.RESET}")
+            _log("success", "✓ Registry address set successfully on TokenSimulation!")
 
-            # Validate that the registry address was set correctly
-            if not self.validate_registry_address_set(tokencore_address, registry_address):
-                print(f"{Colors.ERROR}✗ Registry address validation failed.{Colors.RESET}")
+            # The setter emits RegistryAddressUpdated, so the receipt already tells us the
+            # stored value; without the receipt or the event, get_registry_address is called.
+            new_address = self._registry_update_event(self.tx_waiter.get_receipt(tx_hash), tokencore_address)
+            if new_address is not None:
+                validated = int(new_address, 16) == int(registry_address, 16)
+                if validated:
+                    _log("success", f"✓ Registry address validated from event: {new_address}")
+                else:
+                    _log("error", f"✗ Registry address mismatch! Expected: {registry_address}, got: {new_address}")
+            else:
+                validated = self.validate_registry_address_set(tokencore_address, registry_address)
+            if not validated:
+                _log("error", "✗ Registry address validation failed.")
                 return None
 
             return {
@@ -285,321 +729,360 @@ class ContractDeployer:
             }
 
         except ValueError as e:
-            print(f"{Colors.ERROR}Could not parse transaction hash from output{Colors.RESET}")
-            print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
+            _log("error", "Could not parse transaction hash from output")
+            _log("error", f"Error: {str(e)}")
             return None
 
+    @staticmethod
+    def _registry_update_event(receipt: Optional[Dict[str, Any]], tokencore_address: str) -> Optional[str]:
+        """new_address of the RegistryAddressUpdated event (data: [old, new]) in a receipt, if any."""
+        try:
+            contract = int(tokencore_address, 16)
+            for event in (receipt or {}).get("events", ()):
+                keys = event.get("keys") or ()
+                data = event.get("data") or ()
+                if (keys and int(keys[0], 16) == _REGISTRY_ADDRESS_UPDATED_SELECTOR and len(data) == 2
+                        and int(event.get("from_address", "0x0"), 16) == contract):
+                    int(data[1], 16)  # must be a felt
+                    return data[1]
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return None
+
     def validate_registry_address_set(self, tokencore_address: str, expected_registry_address: str) -> bool:
         """Validate that the registry address was set correctly on the TokenSimulation contract."""
-        print(f"{Colors.INFO}🔍 Validating registry address on TokenSimulation contract...{Colors.RESET}")
-
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "call", "--network", self.network_config.network,
-                "--contract-address", tokencore_address,
-                "--function", "get_registry_address",
-            ]
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "call",
-                "--contract-address", tokencore_address,
-                "--function", "get_registry_address",
-            ]
+        _log("info", "🔍 Validating registry address on TokenSimulation contract...")
+
+        command = self._build_sncast_cmd(
+            "call",
+            "--contract-address", tokencore_address,
+            "--function", "get_registry_address",
+        )
 
         result = CommandRunner.run_command(command, f"Validating registry address on TokenSimulation")
 
         if not result["success"]:
-            print(f"{Colors.ERROR}Failed to call get_registry_address on TokenSimulation:{Colors.RESET}")
-            print(f"{Colors.ERROR}STDOUT: {result['stdout']}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDERR: {result['stderr']}{Colors.RESET}")
+            _log("error", "Failed to call get_registry_address on TokenSimulation:")
+            _log("error", f"STDOUT: {result['stdout']}")
+            _log("error", f"STDERR: {result['stderr']}")
             return False
 
         try:
-            # Parse the returned registry address from the output
-            import re
-            # The output should contain something like "0x[address]"
-            match = re.search(r'0x[a-fA-F0-9]+', result["stdout"])
-            if not match:
-                print(f"{Colors.ERROR}Could not parse registry address from call output{Colors.RESET}")
-                print(f"{Colors.ERROR}Output: {result['stdout']}{Colors.RESET}")
+            # Read the address from the call's response only, not from whatever
+            # else the output contains
+            try:
+                returned = int(StarknetUtils.parse_contract_address_from_call(result["stdout"]), 16)
+            except ValueError:
+                _log("error", "Could not parse registry address from call output")
+                _log("error", f"Output: {result['stdout']}")
                 return False
 
-            returned_address = match.group(0).lower()
-            expected_address = expected_registry_address.lower()
-
-            # Normalize addresses by removing leading zeros after 0x for comparison
-            def normalize_address(addr: str) -> str:
-                if addr.startswith('0x'):
-                    # Remove leading zeros after 0x, but keep at least one zero if the address is all zeros
-                    hex_part = addr[2:].lstrip('0')
-                    return '0x' + (hex_part if hex_part else '0')
-                return addr
-
-            normalized_returned = normalize_address(returned_address)
-            normalized_expected = normalize_address(expected_address)
-
-            if normalized_returned == normalized_expected:
-                print(f"{Colors.SUCCESS}✓ Registry address validated successfully: {returned_address}{Colors.RESET}")
+            # Addresses are felts: compare numerically so leading zeros and case don't matter
+            if returned == int(expected_registry_address, 16):
+                _log("success", f"✓ Registry address validated successfully: {returned:#x}")
                 return True
             else:
-                print(f"{Colors.ERROR}✗ Registry address mismatch!{Colors.RESET}")
-                print(f"{Colors.ERROR}Expected: {expected_address}{Colors.RESET}")
-                print(f"{Colors.ERROR}Got: {returned_address}{Colors.RESET}")
-                print(f"{Colors.ERROR}Normalized Expected: {normalized_expected}{Colors.RESET}")
-                print(f"{Colors.ERROR}Normalized Got: {normalized_returned}{Colors.RESET}")
+                _log("error", "✗ Registry address mismatch!")
+                _log("error", f"Expected: {expected_registry_address}")
+                _log("error", f"Got: {returned:#x}")
                 return False
 
         except Exception as e:
-            print(f"{Colors.ERROR}Error validating registry address: {str(e)}{Colors.RESET}")
+            _log("error", f"Error validating registry address: {str(e)}")
             return False
 
-    def _format_constructor_params(self, owner_address: str, **kwargs) -> Dict[str, Any]:
+    def _format_constructor_params(self, owner_address: str, classified: _ClassifiedKwargs) -> Dict[str, Any]:
         """Format constructor parameters for display."""
-        params = {"owner": owner_address}
-
-        # Add contract-specific parameters
-        for key, value in kwargs.items():
-            if key == 'base_uri':
-                params['base_uri'] = value
-            elif key.endswith('_address'):
-                params[key] = value
-            elif key == 'verifier_address':
-                params['verifier_address'] = value
-            elif key == 'purchase_timeout_seconds':
-                params['purchase_timeout_seconds'] = value
-
-        return params
+        return {"owner": owner_address, **classified.constructor_params}
 
     def print_professional_summary(self, deployment_details: Dict[str, Any], post_deployment_ops: List[Dict[str, Any]] = None):
-        """Print a professional deployment summary."""
-        print(f"\n{Colors.BOLD}{'='*80}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}🎯 CONTRACT DEPLOYMENT SUMMARY{Colors.RESET}")
-        print(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        """Print a professional deployment summary (assembled first, written once)."""
+        bold, reset = Colors.BOLD, Colors.RESET
+        rule = f"{bold}{'='*80}{reset}"
+        out: List[str] = [
+            f"{bold}\n{'='*80}{reset}",
+            f"{bold}{Colors.CYAN}🎯 CONTRACT DEPLOYMENT SUMMARY{reset}",
+            rule,
+        ]
 
         # Contract Info
-        print(f"{Colors.BOLD}📋 Contract Information:{Colors.RESET}")
-        print(f"  Name: {deployment_details['contract_name']}")
-        print(f"  Type: {deployment_details['contract_type']}")
-        print(f"  Address: {Colors.SUCCESS}{deployment_details['contract_address']}{Colors.RESET}")
-        print(f"  Class Hash: {deployment_details['class_hash']}")
-        print(f"  Network: {deployment_details['network']}")
-        print(f"  Owner: {format_address(deployment_details['owner'])}")
+        out += [
+            f"{bold}📋 Contract Information:{reset}",
+            f"  Name: {deployment_details['contract_name']}",
+            f"  Type: {deployment_details['contract_type']}",
+            f"  Address: {Colors.SUCCESS}{deployment_details['contract_address']}{reset}",
+            f"  Class Hash: {deployment_details['class_hash']}",
+            f"  Network: {deployment_details['network']}",
+            f"  Owner: {format_address(deployment_details['owner'])}",
+        ]
 
         # Deployment Transaction
         if deployment_details.get('deployment_tx_hash'):
-            print(f"\n{Colors.BOLD}🚀 Deployment Transaction:{Colors.RESET}")
-            print(f"  Transaction Hash: {Colors.INFO}{deployment_details['deployment_tx_hash']}{Colors.RESET}")
-            print(f"  Status: {Colors.SUCCESS}✓ Confirmed{Colors.RESET}")
+            out += [
+                f"{bold}\n🚀 Deployment Transaction:{reset}",
+                f"  Transaction Hash: {Colors.INFO}{deployment_details['deployment_tx_hash']}{reset}",
+                f"  Status: {Colors.SUCCESS}✓ Confirmed{reset}",
+            ]
 
         # Constructor Parameters
         if deployment_details.get('constructor_params'):
-            print(f"\n{Colors.BOLD}⚙️  Constructor Parameters:{Colors.RESET}")
+            out.append(f"{bold}\n⚙️  Constructor Parameters:{reset}")
             for param, value in deployment_details['constructor_params'].items():
                 if param == 'base_uri':
-                    print(f"  {param}: {Colors.CYAN}{value}{Colors.RESET}")
-                elif param.endswith('_address') or param == 'verifier_address':
-                    print(f"  {param}: {Colors.INFO}{value}{Colors.RESET}")
+                    out.append(_SUMMARY_PARAM_CYAN.format(param, value))
+                elif param.endswith('_address'):
+                    out.append(_SUMMARY_PARAM_INFO.format(param, value))
                 else:
-                    print(f"  {param}: {value}")
+                    out.append(f"  {param}: {value}")
 
         # Post-deployment Operations
         if post_deployment_ops:
-            print(f"\n{Colors.BOLD}🔧 Post-Deployment Operations:{Colors.RESET}")
+            out.append(f"{bold}\n🔧 Post-Deployment Operations:{reset}")
             for i, op in enumerate(post_deployment_ops, 1):
-                print(f"  {i}. {Colors.BOLD}{op['method']}(){Colors.RESET}")
+                out.append(_SUMMARY_OP.format(i, op['method']))
                 if op.get('tx_hash'):
-                    print(f"     Transaction: {Colors.INFO}{op['tx_hash']}{Colors.RESET}")
+                    out.append(_SUMMARY_OP_TX.format(op['tx_hash']))
                 if op.get('params'):
-                    print(f"     Parameters: {op['params']}")
+                    out.append(f"     Parameters: {op['params']}")
                 if op.get('validation'):
-                    print(f"     Validation: {Colors.SUCCESS}{op['validation']}{Colors.RESET}")
+                    out.append(_SUMMARY_OP_VALIDATION.format(op['validation']))
 
         # Explorer Links
         if deployment_details.get('contract_address'):
-            explorer_url = f"{self.network_config.explorer}/contract/{deployment_details['contract_address']}"
-            print(f"\n{Colors.BOLD}🔗 Explorer Links:{Colors.RESET}")
-            print(f"  Contract: {Colors.CYAN}{explorer_url}{Colors.RESET}")
+            links = self._explorer_links(deployment_details['contract_address'], deployment_details.get('class_hash'))
+            out += [
+                f"{bold}\n🔗 Explorer Links:{reset}",
+                f"  Contract: {Colors.CYAN}{links['contract']}{reset}",
+            ]
             if deployment_details.get('class_hash'):
-                class_url = f"{self.network_config.explorer}/class/{deployment_details['class_hash']}"
-                print(f"  Class: {Colors.CYAN}{class_url}{Colors.RESET}")
+                out.append(f"  Class: {Colors.CYAN}{links['class']}{reset}")
 
-        print(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        out.append(rule)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
     def validate_contract(self, contract_address: str, contract_type: str) -> bool:
         """Validate that a contract exists and is of the expected type."""
-        print(f"{Colors.INFO}🔍 Validating {contract_type} contract at {contract_address}...{Colors.RESET}")
-
-        # Define validation functions based on contract type
-        validation_functions = {
-            "nft": "name",           # ERC721
-            "registry": "get_owner",  # Registry specific
-            "token": "balance_of",  # ERC1155
-            "token_simulation": "balance_of",  # ERC1155 (TokenSimulation)
-            "pox": "get_registry_address",  # KliverPox - validates it has registry
-            "verifier": None,  # TODO: Add verifier validation once we know the interface
-            "payment_token": "total_supply",  # ERC20 - validates it's a token contract
-        }
+        _log("info", f"🔍 Validating {contract_type} contract at {contract_address}...")
 
-        function_name = validation_functions.get(contract_type)
+        function_name = _VALIDATION_FUNCTIONS.get(contract_type)
 
         # Special case: verifier contract - we don't know the interface yet
         if contract_type == "verifier":
-            print(f"{Colors.WARNING}⚠️  Verifier contract validation not implemented yet - skipping{Colors.RESET}")
-            print(f"{Colors.INFO}ℹ️  Assuming verifier address {contract_address} is valid{Colors.RESET}")
+            _log("warning", "⚠️  Verifier contract validation not implemented yet - skipping")
+            _log("info", f"ℹ️  Assuming verifier address {contract_address} is valid")
             return True
 
         if not function_name:
-            print(f"{Colors.ERROR}✗ No validation function defined for {contract_type}{Colors.RESET}")
-            print(f"{Colors.ERROR}✗ Cannot proceed with deployment without validation{Colors.RESET}")
+            _log("error", f"✗ No validation function defined for {contract_type}")
+            _log("error", "✗ Cannot proceed with deployment without validation")
             return False
 
-        # Prepare calldata based on function
-        calldata = []
-        if function_name == "balance_of":
-            calldata = ["0x0", "0x1"]  # dummy address and token id for ERC1155
-
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "call", "--network", self.network_config.network,
-                "--contract-address", contract_address,
-                "--function", function_name,
-            ]
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "call",
-                "--contract-address", contract_address,
-                "--function", function_name,
-            ]
+        # Skip the sncast call if this contract passed the same check recently
+        network = self.network_config.network
+        cache_key = f"{contract_type}:{contract_address.lower()}"
+        ttl = self.deployment_settings.validation_cache_ttl
+        if ttl > 0 and _validated_recently(network, cache_key, ttl):
+            _log("success", f"✓ {contract_type.title()} contract validated successfully (cached)")
+            return True
 
-        if calldata:
-            command.extend(["--calldata"] + calldata)
+        # Prepare calldata based on function
+        calldata = _VALIDATION_CALLDATA.get(function_name, ())
+        calldata_args = ("--calldata", *calldata) if calldata else ()
+
+        command = self._build_sncast_cmd(
+            "call",
+            "--contract-address", contract_address,
+            "--function", function_name,
+            *calldata_args,
+        )
 
         result = CommandRunner.run_command(command, f"Validating {contract_type} contract")
 
         if result["success"]:
-            print(f"{Colors.SUCCESS}✓ {contract_type.title()} contract validated successfully{Colors.RESET}")
+            _log("success", f"✓ {contract_type.title()} contract validated successfully")
+            if ttl > 0:
+                _record_validation(network, cache_key)
             return True
         else:
             # Special case: payment_token might be Cairo 0 contract (can't validate with sncast)
-            all_output = result.get("stdout", "") + result.get("stderr", "")
-            if contract_type == "payment_token" and ("Cairo Zero" in all_output or "Transformation of arguments" in all_output):
-                print(f"{Colors.WARNING}⚠️  Payment token appears to be a Cairo 0 contract - cannot validate with sncast{Colors.RESET}")
-                print(f"{Colors.INFO}ℹ️  Assuming payment token address {contract_address} is valid{Colors.RESET}")
+            streams = (result.get("stdout", ""), result.get("stderr", ""))
+            if contract_type == "payment_token" and any(
+                "Cairo Zero" in stream or "Transformation of arguments" in stream for stream in streams
+            ):
+                _log("warning", "⚠️  Payment token appears to be a Cairo 0 contract - cannot validate with sncast")
+                _log("info", f"ℹ️  Assuming payment token address {contract_address} is valid")
                 return True
 
-            print(f"{Colors.ERROR}✗ Invalid {contract_type} contract address or contract not deployed{Colors.RESET}")
-            print(f"{Colors.ERROR}✗ Please verify the address and ensure the contract is deployed{Colors.RESET}")
+            _log("error", f"✗ Invalid {contract_type} contract address or contract not deployed")
+            _log("error", "✗ Please verify the address and ensure the contract is deployed")
             return False
 
-    def save_deployment_info(self, class_hash: str, contract_address: str, owner_address: str, **kwargs):
-        """Save deployment information to a JSON file."""
+    def _explorer_links(self, contract_address: str, class_hash: Optional[str]) -> Dict[str, str]:
+        """Block explorer URLs for a deployed contract and its class."""
+        explorer = self.network_config.explorer
+        return {
+            "contract": f"{explorer}/contract/{contract_address}",
+            "class": f"{explorer}/class/{class_hash}",
+        }
+
+    def save_deployment_info(self, class_hash: str, contract_address: str, owner_address: str, *,
+                             classified: Optional[_ClassifiedKwargs] = None, **kwargs) -> "Future[Path]":
+        """Save deployment information to a JSON file, written in the background; returns the pending write."""
+        if classified is None:
+            classified = _ClassifiedKwargs.from_kwargs(kwargs)
+
         # Get dependency info
         dependency_info = self.contract.get_dependency_info(**kwargs)
+
+        # One clock read, so the filename and the recorded timestamp agree
+        now_ns = time.time_ns()
+        timestamp = now_ns / 1e9
         
         deployment_info = {
-            "environment": self.environment,
-            "network": self.network_config.network,
-            "account": self.network_config.account,
-            "rpc_url": self.network_config.rpc_url,
-            "contract_name": self.contract_config.name,
-            "contract_type": self.contract_type,
+            **self._deploy_info_skeleton,
             "class_hash": class_hash,
             "contract_address": contract_address,
             "owner_address": owner_address,
             "dependencies": dependency_info,
-            "deployment_timestamp": time.time(),
-            "deployment_date": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
-            "explorer_links": {
-                "contract": f"{self.network_config.explorer}/contract/{contract_address}",
-                "class": f"{self.network_config.explorer}/class/{class_hash}"
-            }
+            "deployment_timestamp": timestamp,
+            "deployment_date": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(timestamp)),
+            "explorer_links": self._explorer_links(contract_address, class_hash),
+            # Add specific dependency addresses
+            **classified.addresses,
         }
         
-        # Add specific dependency addresses
-        for key, value in kwargs.items():
-            if key.endswith('_address') and value:
-                deployment_info[key] = value
-        
-        filename = f"deployment_{self.network_config.network}_{self.contract_type}_{int(time.time())}.json"
-        filepath = Path.cwd() / filename
-        
-        with open(filepath, 'w') as f:
-            json.dump(deployment_info, f, indent=2)
-            
-        print(f"{Colors.SUCCESS}✓ Deployment info saved to: {filename}{Colors.RESET}")
+        filename = f"deployment_{self.network_config.network}_{self.contract_type}_{now_ns // 1_000_000_000}.json"
+        # Serialization happens on the I/O thread too; nothing mutates the dict afterwards
+        return _io_pool.submit(_write_json_atomic, Path.cwd() / filename, deployment_info)
+
+    def _deployment_record_path(self, owner_address: str, **kwargs) -> Optional[Path]:
+        """Record file for deploying this artifact with these arguments, or None if the artifact is not on disk."""
+        cache_key = self._declare_cache_key()
+        if cache_key is None:
+            return None
+        network, _, artifact_digest = cache_key
+        fingerprint = hashlib.sha256(json.dumps(
+            [network, artifact_digest, owner_address, sorted(kwargs.items())], default=str
+        ).encode()).hexdigest()
+        return (find_project_root(Path.cwd()) / DEPLOYMENT_RECORDS_DIR
+                / self.environment / self.contract_type / f"{fingerprint}.json")
+
+    def find_existing_deployment(self, record_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Return the recorded deployment if its transaction is still known to the network."""
+        if record_path is None:
+            return None
+        try:
+            record = json.loads(record_path.read_text())
+        except (OSError, ValueError):
+            return None
 
-    def deploy_full_flow(self, owner_address: Optional[str] = None, no_compile: bool = False, **kwargs) -> Optional[Dict[str, Any]]:
+        tx_hash = record.get("deployment_tx_hash")
+        if not tx_hash or not self.tx_waiter.is_confirmed(tx_hash, "Checking recorded deployment"):
+            _log("warning", f"⚠️  Recorded deployment at {record.get('contract_address')} not found on chain, redeploying")
+            return None
+        return record
+
+    def save_deployment_record(self, record_path: Optional[Path], deployment_details: Dict[str, Any]) -> None:
+        """Write the record later runs use to skip an identical deployment."""
+        if record_path is None:
+            return
+        try:
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = record_path.with_suffix(".json.tmp")
+            tmp_file.write_bytes(dumps_indented_bytes(deployment_details))
+            os.replace(tmp_file, record_path)
+        except OSError as e:
+            _log("warning", f"⚠️ Could not write deployment record {record_path}: {e}")
+
+    def deploy_full_flow(self, owner_address: Optional[str] = None, no_compile: bool = False,
+                         reuse_existing: bool = False, **kwargs) -> Optional[Dict[str, Any]]:
         """Execute the complete deployment flow for a single contract."""
-        print(f"{Colors.BOLD}🎯 Deploying {self.contract_config.name} to {self.network_config.network}{Colors.RESET}")
-        print(f"{Colors.INFO}Account: {self.network_config.account} | Network: {self.network_config.network}{Colors.RESET}")
-        print("-" * 50)
+        network = self.network_config.network
+        account = self.network_config.account
+        name = self.contract_config.name
+        _log("bold", f"🎯 Deploying {name} to {network}")
+        _log("info", f"Account: {account} | Network: {network}")
+        _log("info", "-" * 50)
 
         # Check prerequisites
         if not self.check_prerequisites():
             return None
 
-        # Get account info
-        account_address = self.get_account_info()
-        if not account_address:
+        # Compile contract (skip if no_compile is True)
+        def compile_step() -> bool:
+            if no_compile:
+                _log("info", "⏭️ Skipping compilation (--no-compile flag set)")
+                return True
+            if not self.compile_workspace_once((self.contract_config.sierra_file,)):
+                _log("error", "✗ Compilation failed")
+                return False
+            return True
+
+        # Sort the constructor arguments by role once for every step below
+        classified = _ClassifiedKwargs.from_kwargs(kwargs)
+
+        # The account lookup and the dependency validations (e.g., NFT contract
+        # for Registry) are sncast calls independent of the local build and of
+        # each other, so they all run while the workspace compiles
+        validations = [
+            partial(self.validate_contract, dep_address, dep_type)
+            for dep_type, dep_address in classified.dependencies.items()
+        ]
+        account_address, compiled, *validated = run_in_parallel(self.get_account_info, compile_step, *validations)
+        if not account_address or not compiled or not all(validated):
             return None
 
         # Use account address as owner if not specified
         if not owner_address:
             owner_address = account_address
-            print(f"{Colors.INFO}Owner: {format_address(owner_address)}{Colors.RESET}")
-
-        # Validate dependencies (e.g., NFT contract for Registry)
-        for dep_type, dep_address in kwargs.items():
-            if dep_type.endswith('_address') and dep_address:
-                dep_contract_type = dep_type.replace('_address', '')
-                if not self.validate_contract(dep_address, dep_contract_type):
-                    return None
-
-        # Compile contract (skip if no_compile is True)
-        if not no_compile:
-            if not self.compile_contract():
-                print(f"{Colors.ERROR}✗ Compilation failed{Colors.RESET}")
-                return None
-        else:
-            print(f"{Colors.INFO}⏭️ Skipping compilation (--no-compile flag set){Colors.RESET}")
+            _log("info", f"Owner: {format_address(owner_address)}")
+
+        # Reuse an identical earlier deployment instead of sending new transactions.
+        # Records are only read and written when reuse is requested.
+        record_path = self._deployment_record_path(owner_address, **kwargs) if reuse_existing else None
+        if reuse_existing:
+            existing = self.find_existing_deployment(record_path)
+            if existing:
+                _log("success", f"✓ {name} already deployed with the same artifact and arguments: {existing['contract_address']}")
+                _log("info", "ℹ️  Skipping declaration and deployment (--reuse-deployments)")
+                existing["post_deployment_ops"] = []
+                return existing
 
         # Declare contract
         class_hash = self.declare_contract()
         if not class_hash:
-            print(f"{Colors.ERROR}Declaration failed. Deployment aborted.{Colors.RESET}")
+            _log("error", "Declaration failed. Deployment aborted.")
             return None
 
         # Deploy contract
-        deployment_result = self.deploy_contract(class_hash, owner_address, **kwargs)
+        deployment_result = self.deploy_contract(class_hash, owner_address, classified=classified, **kwargs)
         if not deployment_result:
-            print(f"{Colors.ERROR}Deployment failed.{Colors.RESET}")
+            _log("error", "Deployment failed.")
             return None
 
         contract_address = deployment_result["contract_address"]
 
-        # Save deployment info
-        self.save_deployment_info(class_hash, contract_address, owner_address, **kwargs)
+        # Save deployment info (written while the summary details are assembled)
+        saved = self.save_deployment_info(class_hash, contract_address, owner_address, classified=classified, **kwargs)
 
         # Collect deployment details for professional summary
         deployment_details = {
-            "contract_name": self.contract_config.name,
+            "contract_name": name,
             "contract_type": self.contract_type,
             "contract_address": contract_address,
             "class_hash": class_hash,
-            "network": self.network_config.network,
+            "network": network,
             "owner": owner_address,
             "deployment_tx_hash": deployment_result.get("deployment_tx_hash"),
             "constructor_params": deployment_result.get("constructor_params", {}),
+            "post_deployment_ops": [],
+            # Dependency addresses, flat and grouped under 'dependencies'
+            **classified.addresses,
+            "dependencies": classified.dependencies,
         }
-
-        # Add dependency addresses
-        for key, value in kwargs.items():
-            if key.endswith('_address') and value:
-                deployment_details[key] = value
+        self.save_deployment_record(record_path, deployment_details)
+        _log("success", f"✓ Deployment info saved to: {saved.result().name}")
 
         # Print professional summary
         self.print_professional_summary(deployment_details)
@@ -626,43 +1109,30 @@ class ContractDeployer:
             Dictionary with transaction details or None if failed
         """
         desc = description or f"Invoking {method_name}"
-        print(f"{Colors.INFO}🔧 {desc}...{Colors.RESET}")
-
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "invoke", "--network", self.network_config.network,
-                "--contract-address", contract_address,
-                "--function", method_name,
-                "--calldata", *calldata,
-            ]
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "invoke",
-                "--contract-address", contract_address,
-                "--function", method_name,
-                "--calldata", *calldata,
-            ]
+        _log("info", f"🔧 {desc}...")
+
+        command = self._build_sncast_cmd(
+            "invoke",
+            "--contract-address", contract_address,
+            "--function", method_name,
+            "--calldata", *calldata,
+        )
 
-        result = CommandRunner.run_command(command, desc)
+        result = self._submit_transaction(command, desc)
 
         if not result["success"]:
-            print(f"{Colors.ERROR}Failed to invoke {method_name}:{Colors.RESET}")
-            print(f"{Colors.ERROR}STDOUT: {result['stdout']}{Colors.RESET}")
-            print(f"{Colors.ERROR}STDERR: {result['stderr']}{Colors.RESET}")
+            _log("error", f"Failed to invoke {method_name}:")
+            _log("error", f"STDOUT: {result['stdout']}")
+            _log("error", f"STDERR: {result['stderr']}")
             return None
 
         try:
             tx_hash = StarknetUtils.parse_transaction_hash(result["stdout"])
-            print(f"{Colors.INFO}📋 Transaction hash: {tx_hash}{Colors.RESET}")
-
-            print(f"{Colors.BOLD}⏳ Waiting for transaction to be confirmed...{Colors.RESET}")
-            if not self.tx_waiter.wait_for_confirmation(tx_hash):
-                print(f"{Colors.ERROR}✗ Transaction not confirmed.{Colors.RESET}")
+            if not self._await_tx(tx_hash):
+                _log("error", "✗ Transaction not confirmed.")
                 return None
 
-            print(f"{Colors.SUCCESS}✓ {method_name} executed successfully!{Colors.RESET}")
+            _log("success", f"✓ {method_name} executed successfully!")
 
             return {
                 "method": method_name,
@@ -672,10 +1142,126 @@ class ContractDeployer:
             }
 
         except ValueError as e:
-            print(f"{Colors.ERROR}Could not parse transaction hash from output{Colors.RESET}")
-            print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
+            _log("error", "Could not parse transaction hash from output")
+            _log("error", f"Error: {str(e)}")
+            return None
+
+    def invoke_multicall(
+        self,
+        calls: List[Tuple[str, str, List[str]]],
+        description: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Invoke several setter functions in a single transaction via `sncast multicall run`.
+
+        Args:
+            calls: List of (contract_address, method_name, calldata) tuples
+            description: Optional description for logging
+
+        Returns:
+            One transaction details dict per call (sharing the same tx_hash) or None if failed
+        """
+        desc = description or f"Invoking {len(calls)} calls in one multicall"
+        _log("info", f"🔧 {desc}...")
+
+        lines = []
+        for contract_address, method_name, calldata in calls:
+            lines += [
+                "[[call]]",
+                'call_type = "invoke"',
+                f"contract_address = {json.dumps(contract_address)}",
+                f"function = {json.dumps(method_name)}",
+                f"inputs = {json.dumps(list(calldata))}",
+                "",
+            ]
+
+        fd, calls_path = tempfile.mkstemp(prefix="kliver_multicall_", suffix=".toml")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(lines))
+
+            command = self._build_sncast_cmd(
+                "multicall run",
+                "--path", calls_path,
+            )
+
+            result = self._submit_transaction(command, desc)
+        finally:
+            os.unlink(calls_path)
+
+        if not result["success"]:
+            _log("error", "Failed to run multicall:")
+            _log("error", f"STDOUT: {result['stdout']}")
+            _log("error", f"STDERR: {result['stderr']}")
             return None
 
+        try:
+            tx_hash = StarknetUtils.parse_transaction_hash(result["stdout"])
+            if not self._await_tx(tx_hash):
+                _log("error", "✗ Transaction not confirmed.")
+                return None
+
+            _log("success", f"✓ {', '.join(c[1] for c in calls)} executed successfully!")
+
+            return [
+                {
+                    "method": method_name,
+                    "tx_hash": tx_hash,
+                    "calldata": list(calldata),
+                    "contract_address": contract_address,
+                }
+                for contract_address, method_name, calldata in calls
+            ]
+
+        except ValueError as e:
+            _log("error", "Could not parse transaction hash from output")
+            _log("error", f"Error: {str(e)}")
+            return None
+
+    def invoke_setters_batch(
+        self,
+        calls: List[Tuple[str, str, List[str]]],
+        description: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Send several `set_*` calls in one multicall transaction, then read each
+        value back through the matching `get_*` view, all reads in parallel.
+
+        Args:
+            calls: List of (contract_address, set_method_name, calldata) tuples
+            description: Optional description for logging
+
+        Returns:
+            One transaction details dict per call, with "validation" set for each
+            single-argument setter whose value read back as written, or None if
+            the transaction failed
+        """
+        results = self.invoke_multicall(calls, description)
+        if not results:
+            return None
+
+        def read_back(contract_address: str, method_name: str) -> Optional[str]:
+            if not method_name.startswith("set_"):
+                return None
+            return self.call_view_method(contract_address, "get_" + method_name[len("set_"):])
+
+        actual_values = run_in_parallel(*(
+            partial(read_back, contract_address, method_name) for contract_address, method_name, _ in calls
+        ))
+
+        for result, (contract_address, method_name, calldata), actual in zip(results, calls, actual_values):
+            if actual is None or len(calldata) != 1:
+                continue
+            written, returned = _felt(str(calldata[0])), _felt(actual)
+            if written is not None and written == returned:
+                _log("success", f"✓ {method_name} validated on {format_address(contract_address)}")
+                result["validation"] = f"✓ {method_name[len('set_'):]} validated"
+            else:
+                _log("warning", f"⚠️ {method_name} mismatch on {format_address(contract_address)} "
+                                f"(expected: {calldata[0]}, got: {actual})")
+
+        return results
+
     def call_view_method(
         self,
         contract_address: str,
@@ -693,25 +1279,16 @@ class ContractDeployer:
         Returns:
             Parsed result or None if failed
         """
-        if self.network_config.network in ("mainnet", "sepolia"):
-            command = [
-                "sncast", "--account", self.network_config.account,
-                "call", "--network", self.network_config.network,
-                "--contract-address", contract_address,
-                "--function", method_name,
-            ]
-        else:
-            command = [
-                "sncast", "--profile", self.network_config.network,
-                "call",
-                "--contract-address", contract_address,
-                "--function", method_name,
-            ]
+        calldata_args = ("--calldata", *calldata) if calldata else ()
 
-        if calldata:
-            command.extend(["--calldata", *calldata])
+        command = self._build_sncast_cmd(
+            "call",
+            "--contract-address", contract_address,
+            "--function", method_name,
+            *calldata_args,
+        )
 
-        result = CommandRunner.run_command(command, f"Calling {method_name}", verbose=False)
+        result = CommandRunner.run_command(command, f"Calling {method_name}")
 
         if not result["success"]:
             return None
@@ -720,8 +1297,8 @@ class ContractDeployer:
             # Try to parse as address first
             return StarknetUtils.parse_contract_address_from_call(result["stdout"])
         except ValueError:
-            # If not an address, return raw output
-            return result["stdout"].strip()
+            # If not an address, return the plain response
+            return StarknetUtils.parse_call_response(result["stdout"])
 
     def set_registry_address(
         self,
@@ -752,13 +1329,11 @@ class ContractDeployer:
             # Validate
             actual = self.call_view_method(contract_address, "get_registry_address")
             if actual:
-                expected = registry_address.lower().replace('0x', '').lstrip('0')
-                returned = actual.lower().replace('0x', '').lstrip('0')
-                if expected == returned:
-                    print(f"{Colors.SUCCESS}✓ Registry address validated on {name}{Colors.RESET}")
+                if canon(actual) == canon(registry_address):
+                    _log("success", f"✓ Registry address validated on {name}")
                     result["validation"] = "✓ Registry address validated"
                 else:
-                    print(f"{Colors.WARNING}⚠️ Registry address mismatch on {name}{Colors.RESET}")
+                    _log("warning", f"⚠️ Registry address mismatch on {name}")
         
         return result
 
@@ -788,13 +1363,11 @@ class ContractDeployer:
             # Validate
             actual = self.call_view_method(registry_address, "get_kliver_pox_address")
             if actual:
-                expected = pox_address.lower().replace('0x', '').lstrip('0')
-                returned = actual.lower().replace('0x', '').lstrip('0')
-                if expected == returned:
-                    print(f"{Colors.SUCCESS}✓ KliverPox address validated on Registry{Colors.RESET}")
+                if canon(actual) == canon(pox_address):
+                    _log("success", "✓ KliverPox address validated on Registry")
                     result["validation"] = "✓ KliverPox address validated"
                 else:
-                    print(f"{Colors.WARNING}⚠️ KliverPox address mismatch{Colors.RESET}")
+                    _log("warning", "⚠️ KliverPox address mismatch")
         
         return result
 
@@ -824,13 +1397,11 @@ class ContractDeployer:
             # Validate
             actual = self.call_view_method(registry_address, "get_verifier_address")
             if actual:
-                expected = verifier_address.lower().replace('0x', '').lstrip('0')
-                returned = actual.lower().replace('0x', '').lstrip('0')
-                if expected == returned:
-                    print(f"{Colors.SUCCESS}✓ Verifier address validated on Registry{Colors.RESET}")
+                if canon(actual) == canon(verifier_address):
+                    _log("success", "✓ Verifier address validated on Registry")
                     result["validation"] = "✓ Verifier address validated"
                 else:
-                    print(f"{Colors.WARNING}⚠️ Verifier address mismatch{Colors.RESET}")
+                    _log("warning", "⚠️ Verifier address mismatch")
         
         return result
 
@@ -860,13 +1431,11 @@ class ContractDeployer:
             # Validate
             actual = self.call_view_method(marketplace_address, "get_payment_token")
             if actual:
-                expected = payment_token_address.lower().replace('0x', '').lstrip('0')
-                returned = actual.lower().replace('0x', '').lstrip('0')
-                if expected == returned:
-                    print(f"{Colors.SUCCESS}✓ Payment Token address validated on Marketplace{Colors.RESET}")
+                if canon(actual) == canon(payment_token_address):
+                    _log("success", "✓ Payment Token address validated on Marketplace")
                     result["validation"] = "✓ Payment Token address validated"
                 else:
-                    print(f"{Colors.WARNING}⚠️ Payment Token address mismatch{Colors.RESET}")
+                    _log("warning", "⚠️ Payment Token address mismatch")
         
         return result
 
@@ -896,13 +1465,11 @@ class ContractDeployer:
             # Validate
             actual = self.call_view_method(marketplace_address, "get_pox_address")
             if actual:
-                expected = pox_address.lower().replace('0x', '').lstrip('0')
-                returned = actual.lower().replace('0x', '').lstrip('0')
-                if expected == returned:
-                    print(f"{Colors.SUCCESS}✓ KliverPox address validated on Marketplace{Colors.RESET}")
+                if canon(actual) == canon(pox_address):
+                    _log("success", "✓ KliverPox address validated on Marketplace")
                     result["validation"] = "✓ KliverPox address validated"
                 else:
-                    print(f"{Colors.WARNING}⚠️ KliverPox address mismatch{Colors.RESET}")
+                    _log("warning", "⚠️ KliverPox address mismatch")
         
         return result
 
@@ -933,10 +1500,110 @@ class ContractDeployer:
             actual = self.call_view_method(marketplace_address, "get_purchase_timeout")
             if actual:
                 if actual == str(timeout_seconds):
-                    print(f"{Colors.SUCCESS}✓ Purchase timeout validated on Marketplace ({timeout_seconds}s){Colors.RESET}")
+                    _log("success", f"✓ Purchase timeout validated on Marketplace ({timeout_seconds}s)")
                     result["validation"] = f"✓ Purchase timeout validated ({timeout_seconds}s)"
                 else:
-                    print(f"{Colors.WARNING}⚠️ Purchase timeout mismatch (expected: {timeout_seconds}, got: {actual}){Colors.RESET}")
+                    _log("warning", f"⚠️ Purchase timeout mismatch (expected: {timeout_seconds}, got: {actual})")
         
         return result
 
+
+@dataclass(frozen=True)
+class DeploySpec:
+    """One contract for deploy_many()."""
+    contract_type: str
+    # Constructor arguments passed to deploy_full_flow (e.g. base_uri)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Constructor argument -> contract type whose deployed address fills it,
+    # e.g. {"nft_address": "nft"}
+    depends_on: Dict[str, str] = field(default_factory=dict)
+
+
+def _deployment_waves(specs: List[DeploySpec]) -> Optional[List[List[DeploySpec]]]:
+    """
+    Group specs into waves whose dependencies are all deployed by earlier waves.
+
+    Returns None (after logging the contract types that can't be resolved) if
+    the dependencies form a cycle or name a contract type not in `specs`.
+    """
+    waves: List[List[DeploySpec]] = []
+    done: Set[str] = set()
+    pending = list(specs)
+    while pending:
+        wave = [spec for spec in pending if all(dep in done for dep in spec.depends_on.values())]
+        if not wave:
+            missing = sorted({dep for spec in pending for dep in spec.depends_on.values()} - done)
+            _log("error", f"✗ Unresolvable dependencies: {', '.join(missing)}")
+            return None
+        waves.append(wave)
+        done.update(spec.contract_type for spec in wave)
+        pending = [spec for spec in pending if spec not in wave]
+    return waves
+
+
+def deploy_many(
+    environment: str,
+    specs: List[DeploySpec],
+    owner_address: Optional[str] = None,
+    config_manager: Optional[ConfigManager] = None,
+    no_compile: bool = False,
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Deploy several contracts, sharing the fixed costs between them.
+
+    Prerequisites and the workspace build run once, every class is declared up
+    front (their confirmations are polled together), and deployments run
+    in waves: each wave holds the specs whose dependencies are already deployed.
+
+    Returns the deployment details keyed by contract type, or None if any step
+    failed. Dependency cycles and dependencies on contracts not in `specs` are
+    rejected before anything is built or sent.
+    """
+    if not specs:
+        return {}
+
+    waves = _deployment_waves(specs)
+    if waves is None:
+        return None
+
+    base = ContractDeployer(environment, specs[0].contract_type, config_manager)
+    if not base.check_prerequisites():
+        return None
+    sierra_files = [
+        base.config_manager.get_contract_config(environment, spec.contract_type).sierra_file for spec in specs
+    ]
+    if not no_compile and not base.compile_workspace_once(sierra_files):
+        _log("error", "✗ Compilation failed")
+        return None
+
+    # Submissions are serialized on the account anyway, so the declarations go
+    # out one after another and their confirmations are polled together
+    deployers = {spec.contract_type: base.for_contract(spec.contract_type) for spec in specs}
+    declared = [deployer.send_declaration() for deployer in deployers.values()]
+    if not all(class_hash for class_hash, _ in declared):
+        _log("error", "✗ Declaration failed. Deployment aborted.")
+        return None
+    tx_hashes = [tx_hash for _, tx_hash in declared if tx_hash]
+    for tx_hash in tx_hashes:
+        _log("info", f"📋 Transaction hash: {tx_hash}")
+    if tx_hashes and not base.tx_waiter.wait_for_all(tx_hashes):
+        _log("error", "✗ Declaration transactions not confirmed. Deployment aborted.")
+        return None
+    for deployer, (class_hash, tx_hash) in zip(deployers.values(), declared):
+        if tx_hash:
+            deployer.remember_class_hash(class_hash)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for wave in waves:
+        def deploy(spec: DeploySpec) -> Optional[Dict[str, Any]]:
+            resolved = {arg: results[dep]["contract_address"] for arg, dep in spec.depends_on.items()}
+            return deployers[spec.contract_type].deploy_full_flow(
+                owner_address, no_compile=no_compile, **spec.kwargs, **resolved
+            )
+
+        for spec, result in zip(wave, run_in_parallel(*(partial(deploy, spec) for spec in wave))):
+            if not result:
+                return None
+            results[spec.contract_type] = result
+
+    return results
@@ -2,27 +2,103 @@
 Utility functions for Kliver contract deployment.
 """
 
+import io
+import os
+import random
 import subprocess
+import sys
+import threading
 import time
 import re
 import json
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 from colorama import Fore, Style, init
 
+try:  # optional: faster JSON encoding when installed
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize colorama for cross-platform colored output
 init()
 
 
+# Any non-empty NO_COLOR disables ANSI escapes (https://no-color.org)
+_USE_COLOR = not os.environ.get("NO_COLOR")
+
+
+def _color(code: str) -> str:
+    return code if _USE_COLOR else ""
+
+
 class Colors:
-    """Color constants for terminal output"""
-    SUCCESS = Fore.GREEN
-    ERROR = Fore.RED
-    WARNING = Fore.YELLOW
-    INFO = Fore.BLUE
-    CYAN = Fore.CYAN
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
+    """Color constants for terminal output (empty strings when NO_COLOR is set)"""
+    SUCCESS = _color(Fore.GREEN)
+    ERROR = _color(Fore.RED)
+    WARNING = _color(Fore.YELLOW)
+    INFO = _color(Fore.BLUE)
+    CYAN = _color(Fore.CYAN)
+    BOLD = _color(Style.BRIGHT)
+    RESET = _color(Style.RESET_ALL)
+
+
+# Status line templates, built once: SUCCESS_TPL.format("✓ Done")
+SUCCESS_TPL = f"{Colors.SUCCESS}{{}}{Colors.RESET}"
+ERROR_TPL = f"{Colors.ERROR}{{}}{Colors.RESET}"
+
+# Bold horizontal rules for summaries
+SEP_EQ_BOLD = f"{Colors.BOLD}{'=' * 100}{Colors.RESET}"
+SEP_DASH_BOLD = f"{Colors.BOLD}{'-' * 50}{Colors.RESET}"
+
+
+# Upper bound on sncast/scarb processes running at the same time. Every sncast
+# call opens its own RPC connection, so this keeps concurrent deployment steps
+# from saturating the node.
+MAX_CONCURRENT_COMMANDS = 10
+_command_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMMANDS)
+
+
+@lru_cache(maxsize=None)
+def find_project_root(start: Path) -> Path:
+    """Find the project root by looking for Scarb.toml upwards from start."""
+    project_root = start
+    while project_root != project_root.parent:
+        if (project_root / "Scarb.toml").exists():
+            break
+        project_root = project_root.parent
+    return project_root
+
+
+# Networks sncast reaches with --account/--network; any other network name is
+# an sncast profile (local/katana), which gives proper account resolution.
+_PUBLIC_NETWORKS = ("mainnet", "sepolia")
+
+
+def uses_sncast_profile(network: str) -> bool:
+    """Whether sncast addresses `network` through --profile instead of --account/--network."""
+    return network not in _PUBLIC_NETWORKS
+
+
+@lru_cache(maxsize=None)
+def _sncast_flags(account: str, network: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """(global flags, per-subcommand network flag) for an account on a network."""
+    if uses_sncast_profile(network):
+        return ("sncast", "--json", "--profile", network), ()
+    return ("sncast", "--json", "--account", account), ("--network", network)
+
+
+def sncast_command(account: str, network: str, verb: str, *extras: str) -> List[str]:
+    """
+    Assemble an sncast command line: global flags, subcommand (e.g. "multicall run"),
+    network flag, extras. --json makes the output machine-readable; the
+    StarknetUtils parsers read it and fall back to the text format.
+    """
+    base, network_args = _sncast_flags(account, network)
+    return [*base, *verb.split(), *network_args, *extras]
 
 
 class CommandRunner:
@@ -32,20 +108,16 @@ class CommandRunner:
     def run_command(command: List[str], description: str, show_output: bool = False) -> Dict[str, Any]:
         """Execute a shell command and return the result."""
         try:
-            # Find project root by looking for Scarb.toml
-            project_root = Path.cwd()
-            while project_root != project_root.parent:
-                if (project_root / "Scarb.toml").exists():
-                    break
-                project_root = project_root.parent
+            project_root = find_project_root(Path.cwd())
             
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=project_root  # Run from project root
-            )
+            with _command_slots:
+                result = subprocess.run(
+                    command,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    cwd=project_root  # Run from project root
+                )
             
             if show_output and result.stdout.strip():
                 print(f"{Colors.INFO}➤ {description}...{Colors.RESET}")
@@ -68,6 +140,110 @@ class CommandRunner:
                 "stderr": e.stderr or "",
                 "returncode": e.returncode
             }
+        except OSError as e:
+            return CommandRunner._launch_failed(description, e)
+
+    @staticmethod
+    def _launch_failed(description: str, error: OSError) -> Dict[str, Any]:
+        """Result for a command that could not be started (e.g. the binary is not installed)."""
+        print(f"{Colors.ERROR}✗ {description} failed{Colors.RESET}")
+        print(f"{Colors.ERROR}Error: {error}{Colors.RESET}")
+        return {
+            "success": False,
+            "stdout": "",
+            "stderr": str(error),
+            "returncode": None
+        }
+
+    @staticmethod
+    def run_command_stream(command: List[str], description: str,
+                           on_line: Callable[[str], bool]) -> Dict[str, Any]:
+        """
+        Execute a command with stderr merged into stdout, feeding lines to on_line as they arrive.
+
+        Once on_line returns True the rest of the output is drained without
+        being kept, so "stdout" in the result only holds the lines up to that
+        point and "stderr" is always empty.
+        """
+        project_root = find_project_root(Path.cwd())
+        kept: List[str] = []
+
+        try:
+            with _command_slots:
+                with subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    cwd=project_root  # Run from project root
+                ) as process:
+                    done = False
+                    for line in process.stdout:
+                        if not done:
+                            kept.append(line)
+                            done = on_line(line)
+                    returncode = process.wait()
+        except OSError as e:
+            return CommandRunner._launch_failed(description, e)
+
+        output = "".join(kept)
+        if returncode != 0:
+            print(f"{Colors.ERROR}✗ {description} failed{Colors.RESET}")
+            if output.strip():
+                print(f"{Colors.ERROR}Error: {output.strip()}{Colors.RESET}")
+        return {
+            "success": returncode == 0,
+            "stdout": output,
+            "stderr": "",
+            "returncode": returncode
+        }
+
+
+# Text-output patterns for the StarknetUtils parsers, compiled once and tried in order
+_HEX_RE = re.compile(r"0x[a-fA-F0-9]+")
+_CONTRACT_ADDRESS_PATTERNS = tuple(map(re.compile, (
+    r"(?:contract_address:|Contract Address:)\s*(0x[a-fA-F0-9]+)",
+    r"Contract deployed at:\s*(0x[a-fA-F0-9]+)",
+    r"Deployed contract address:\s*(0x[a-fA-F0-9]+)",
+)))
+_CLASS_HASH_PATTERNS = tuple(map(re.compile, (
+    r"(?:class_hash:|Class Hash:)\s*(0x[a-fA-F0-9]+)",
+    r"Contract class hash:\s*(0x[a-fA-F0-9]+)",
+    r"Declared class hash:\s*(0x[a-fA-F0-9]+)",
+)))
+_TRANSACTION_HASH_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:transaction_hash:|Transaction Hash:)\s*(0x[a-fA-F0-9]+)",
+    r"Transaction hash:\s*(0x[a-fA-F0-9]+)",
+    r"Tx hash:\s*(0x[a-fA-F0-9]+)",
+    # Case-insensitive pattern to catch all variations
+    r"transaction\s*hash:\s*(0x[a-fA-F0-9]+)",
+    # Additional patterns for invoke output
+    r"Invoke transaction:\s*(0x[a-fA-F0-9]+)",
+    r"invoke_tx_hash:\s*(0x[a-fA-F0-9]+)",
+))
+# Call output like ContractAddress(0x123...), Response: ContractAddress(0x123...)
+# or a raw address (63-66 chars for StarkNet)
+_CALL_ADDRESS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"ContractAddress\((0x[a-fA-F0-9]+)\)",
+    r"Response:\s*ContractAddress\((0x[a-fA-F0-9]+)\)",
+    r"(0x[a-fA-F0-9]{63,66})",
+))
+
+
+def _json_field(output: str, key: str) -> Optional[Any]:
+    """Value of `key` in the last JSON object printed by `sncast --json`, or None."""
+    for line in reversed(output.splitlines()):
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            value = json.loads(line).get(key)
+        except (ValueError, AttributeError):
+            continue
+        if value is not None:
+            return value
+    return None
 
 
 class StarknetUtils:
@@ -111,14 +287,12 @@ class StarknetUtils:
     @staticmethod
     def parse_contract_address(output: str) -> str:
         """Parse contract address from sncast deploy output."""
-        patterns = [
-            r"(?:contract_address:|Contract Address:)\s*(0x[a-fA-F0-9]+)",
-            r"Contract deployed at:\s*(0x[a-fA-F0-9]+)",
-            r"Deployed contract address:\s*(0x[a-fA-F0-9]+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output)
+        address = _json_field(output, "contract_address")
+        if address:
+            return address
+
+        for pattern in _CONTRACT_ADDRESS_PATTERNS:
+            match = pattern.search(output)
             if match:
                 return match.group(1)
         
@@ -127,14 +301,12 @@ class StarknetUtils:
     @staticmethod
     def parse_class_hash(output: str) -> str:
         """Parse class hash from sncast declare output."""
-        patterns = [
-            r"(?:class_hash:|Class Hash:)\s*(0x[a-fA-F0-9]+)",
-            r"Contract class hash:\s*(0x[a-fA-F0-9]+)",
-            r"Declared class hash:\s*(0x[a-fA-F0-9]+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output)
+        class_hash = _json_field(output, "class_hash")
+        if class_hash:
+            return class_hash
+
+        for pattern in _CLASS_HASH_PATTERNS:
+            match = pattern.search(output)
             if match:
                 return match.group(1)
         
@@ -143,83 +315,286 @@ class StarknetUtils:
     @staticmethod
     def parse_transaction_hash(output: str) -> str:
         """Parse transaction hash from sncast output."""
-        patterns = [
-            r"(?:transaction_hash:|Transaction Hash:)\s*(0x[a-fA-F0-9]+)",
-            r"Transaction hash:\s*(0x[a-fA-F0-9]+)",
-            r"Tx hash:\s*(0x[a-fA-F0-9]+)",
-            # Case-insensitive pattern to catch all variations
-            r"transaction\s*hash:\s*(0x[a-fA-F0-9]+)",
-            # Additional patterns for invoke output
-            r"Invoke transaction:\s*(0x[a-fA-F0-9]+)",
-            r"invoke_tx_hash:\s*(0x[a-fA-F0-9]+)",
-        ]
+        tx_hash = _json_field(output, "transaction_hash")
+        if tx_hash:
+            return tx_hash
 
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _TRANSACTION_HASH_PATTERNS:
+            match = pattern.search(output)
             if match:
                 return match.group(1)
 
         raise ValueError("Could not parse transaction hash from output")
 
+    @staticmethod
+    def parse_call_response(output: str) -> str:
+        """The value(s) returned by `sncast call`, without the surrounding brackets; raw output as fallback."""
+        response = _json_field(output, "response")
+        if isinstance(response, str):
+            return response.strip().strip("[]").strip()
+        return output.strip()
+
     @staticmethod
     def parse_contract_address_from_call(output: str) -> str:
         """Parse contract address from sncast call output (ContractAddress format)."""
-        # Match patterns like: ContractAddress(0x123...)
-        # or Response: ContractAddress(0x123...)
-        patterns = [
-            r"ContractAddress\((0x[a-fA-F0-9]+)\)",
-            r"Response:\s*ContractAddress\((0x[a-fA-F0-9]+)\)",
-            r"(0x[a-fA-F0-9]{63,66})",  # Raw address (63-66 chars for StarkNet)
-        ]
+        response = _json_field(output, "response")
+        if isinstance(response, str):
+            match = _HEX_RE.search(response)
+            if match:
+                return match.group(0)
 
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _CALL_ADDRESS_PATTERNS:
+            match = pattern.search(output)
             if match:
                 return match.group(1)
 
         raise ValueError("Could not parse contract address from call output")
 
 
+# Transaction status fields, named the same by the RPC node and `sncast tx-status`
+_STATUS_FIELDS = ("finality_status", "execution_status")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _status_key(status: Any) -> str:
+    """Status name without case or underscores, so ACCEPTED_ON_L2 and AcceptedOnL2 compare equal."""
+    return str(status).replace("_", "").lower()
+
+
 class TransactionWaiter:
-    """Handles waiting for transaction confirmation."""
-    
-    def __init__(self, account: str, rpc_url: str, network: str = ""):
+    """
+    Handles waiting for transaction confirmation.
+
+    A transaction counts as confirmed as soon as it reports one of
+    `success_states`; by default that is L2 acceptance, so nothing waits for
+    L1 finality. Polling starts at `base_delay` and backs off to `max_delay`.
+    Short delays surface confirmations quickly, and chained sends stay safe
+    because ContractDeployer retries when the account nonce is still taken.
+    Status is read from the RPC node directly, batching every pending hash
+    into one request, with `sncast tx-status` as the fallback. Both report
+    the same statuses (ACCEPTED_ON_L2 over RPC, AcceptedOnL2 from sncast), and
+    a state matches either spelling.
+    """
+
+    DEFAULT_SUCCESS_STATES: Tuple[str, ...] = ("AcceptedOnL2", "Succeeded")
+
+    def __init__(self, account: str, rpc_url: str, network: str = "", max_wait: float = 180,
+                 base_delay: float = 0.1, backoff_factor: float = 2.0, max_delay: float = 5.0,
+                 success_states: Tuple[str, ...] = DEFAULT_SUCCESS_STATES):
         self.account = account
         self.rpc_url = rpc_url
         self.network = network
+        self.max_wait = max_wait
+        self.base_delay = base_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.success_states = success_states
+        self._success_keys = frozenset(map(_status_key, success_states))
+        # Cleared the first time the node can't be queried directly
+        self._rpc_usable = True
     
-    def wait_for_confirmation(self, tx_hash: str, max_attempts: int = 60) -> bool:
-        """Wait for transaction confirmation."""
-        print(f"{Colors.INFO}⏳ Waiting for transaction confirmation: {tx_hash}{Colors.RESET}")
-
-        for attempt in range(max_attempts):
-            if self.network in ("mainnet", "sepolia"):
-                command = [
-                    "sncast", "--account", self.account,
-                    "tx-status", "--network", self.network,
-                    tx_hash
-                ]
-            else:
-                command = [
-                    "sncast", "--profile", self.network,
-                    "tx-status",
-                    tx_hash
-                ]
-            
-            result = CommandRunner.run_command(command, f"Checking transaction status (attempt {attempt + 1})")
-            
-            if result["success"] and ("AcceptedOnL2" in result["stdout"] or "Succeeded" in result["stdout"]):
-                print(f"{Colors.SUCCESS}✓ Transaction confirmed{Colors.RESET}")
-                return True
-                
-            if attempt < max_attempts - 1:  # Don't sleep on the last attempt
-                print(f"{Colors.WARNING}⏳ Transaction still pending... waiting 5 seconds (attempt {attempt + 1}/{max_attempts}){Colors.RESET}")
-                time.sleep(5)
-            
-        print(f"{Colors.ERROR}✗ Transaction confirmation timeout after {max_attempts * 5} seconds{Colors.RESET}")
-        return False
+    def is_confirmed(self, tx_hash: str, description: str = "Checking transaction status") -> bool:
+        """Query the transaction status once; True if it reached one of the success states."""
+        command = sncast_command(self.account, self.network, "tx-status", tx_hash)
+
+        result = CommandRunner.run_command(command, description)
+        if not result["success"]:
+            return False
+        # --json output carries the status fields; plain text lists them as "field: Status"
+        statuses = [_json_field(result["stdout"], field) for field in _STATUS_FIELDS]
+        if not any(statuses):
+            statuses = _WORD_RE.findall(result["stdout"])
+        return self._reached_success(statuses)
+
+    def _reached_success(self, statuses: Iterable[Any]) -> bool:
+        """Whether any of the reported statuses is one of the success states."""
+        return any(_status_key(status) in self._success_keys for status in statuses if status)
+
+    def _rpc(self, payload: Any, timeout: float = 10) -> Optional[Any]:
+        """POST a JSON-RPC request (or batch) to the node; the decoded response, or None on failure."""
+        try:
+            request = urllib.request.Request(
+                self.rpc_url, data=json.dumps(payload).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.load(response)
+        except (OSError, ValueError):
+            return None
+
+    def get_receipt(self, tx_hash: str, timeout: float = 10) -> Optional[Dict[str, Any]]:
+        """Fetch a transaction receipt straight from the RPC node; None if it can't be retrieved."""
+        response = self._rpc({
+            "jsonrpc": "2.0", "id": 1,
+            "method": "starknet_getTransactionReceipt",
+            "params": {"transaction_hash": tx_hash},
+        }, timeout)
+        return response.get("result") if isinstance(response, dict) else None
+
+    def _confirmed_via_rpc(self, tx_hashes: List[str]) -> Optional[Set[str]]:
+        """
+        The subset of tx_hashes that reached a success state, from one JSON-RPC
+        batch of starknet_getTransactionStatus calls; None if the node can't be used.
+        """
+        response = self._rpc([
+            {"jsonrpc": "2.0", "id": i, "method": "starknet_getTransactionStatus",
+             "params": {"transaction_hash": tx_hash}}
+            for i, tx_hash in enumerate(tx_hashes)
+        ])
+        if not isinstance(response, list):
+            return None
+
+        confirmed = set()
+        for item in response:
+            status = item.get("result") if isinstance(item, dict) else None
+            if not isinstance(status, dict) or not isinstance(item.get("id"), int) \
+                    or not 0 <= item["id"] < len(tx_hashes):
+                continue
+            if self._reached_success(status.get(field) for field in _STATUS_FIELDS):
+                confirmed.add(tx_hashes[item["id"]])
+        return confirmed
+
+    def wait_for_confirmation(self, tx_hash: str, max_wait: Optional[float] = None) -> bool:
+        """Wait for transaction confirmation, polling with jittered exponential backoff."""
+        return self.wait_for_all([tx_hash], max_wait)
+
+    def wait_for_all(self, tx_hashes: List[str], max_wait: Optional[float] = None) -> bool:
+        """
+        Wait until every transaction is confirmed, polling all pending ones per tick.
+
+        Each tick asks the RPC node about every pending hash in one batch
+        request. If the node can't be reached directly, the waiter falls back
+        to one `sncast tx-status` per pending hash for the rest of its life.
+        """
+        pending = list(dict.fromkeys(tx_hashes))
+        total = len(pending)
+        if total == 1:
+            print(f"{Colors.INFO}⏳ Waiting for transaction confirmation: {pending[0]}{Colors.RESET}")
+        else:
+            print(f"{Colors.INFO}⏳ Waiting for {len(pending)} transaction confirmations{Colors.RESET}")
+
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        attempt = 0
+
+        while pending:
+            confirmed = self._confirmed_via_rpc(pending) if self._rpc_usable else None
+            if confirmed is None:
+                self._rpc_usable = False
+                confirmed = {
+                    tx_hash for tx_hash in pending
+                    if self.is_confirmed(tx_hash, f"Checking transaction status (attempt {attempt + 1})")
+                }
+            pending = [tx_hash for tx_hash in pending if tx_hash not in confirmed]
+            if not pending:
+                break
+
+            delay = min(self.max_delay, self.base_delay * self.backoff_factor ** attempt) + random.random() * 0.1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"{Colors.ERROR}✗ Transaction confirmation timeout after {max_wait:g} seconds{Colors.RESET}")
+                return False
+            delay = min(delay, remaining)
+            attempt += 1
+            label = "Transaction" if len(pending) == 1 else f"{len(pending)} transactions"
+            print(f"{Colors.WARNING}⏳ {label} still pending... waiting {delay:.1f} seconds (attempt {attempt}){Colors.RESET}")
+            time.sleep(delay)
+
+        if total == 1:
+            print(f"{Colors.SUCCESS}✓ Transaction confirmed{Colors.RESET}")
+        else:
+            print(f"{Colors.SUCCESS}✓ All {total} transactions confirmed{Colors.RESET}")
+        return True
+
+
+class _ThreadLocalStdout:
+    """sys.stdout proxy that lets individual threads divert their output into a buffer."""
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def sink(self) -> Any:
+        """Where the current thread's output goes: its buffer, or the real stdout."""
+        sink = getattr(self._local, "sink", None)
+        return self.target if sink is None else sink
+
+    def write(self, text: str) -> int:
+        sink = self.sink()
+        # Two threads can share a sink (see run_in_parallel), so writes are serialized
+        with self._lock:
+            return sink.write(text)
+
+    def flush(self) -> None:
+        if self.sink() is self.target:
+            self.target.flush()
 
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
 
+    def run(self, task: Callable[[], Any], sink: Any) -> Dict[str, Any]:
+        """Run task in the current thread with its output sent to sink, collecting its result or exception."""
+        self._local.sink = sink
+        try:
+            return {"result": task(), "error": None}
+        except Exception as e:
+            return {"result": None, "error": e}
+        finally:
+            self._local.sink = None
+
+
+def run_in_parallel(*tasks: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent callables concurrently in worker threads.
+
+    The first task prints straight through, so a long confirmation wait in it
+    still shows progress. Every other task's output is buffered and written as
+    one block as soon as that task finishes, so logs stay readable. Results
+    are returned in task order; the first exception (in task order) raised by
+    a task is re-raised once all have finished. KeyboardInterrupt and
+    SystemExit are not held back: they propagate at once and tasks that
+    haven't started are cancelled.
+    """
+    installed = not isinstance(sys.stdout, _ThreadLocalStdout)
+    if installed:
+        sys.stdout = _ThreadLocalStdout(sys.stdout)
+    proxy = sys.stdout
+
+    # The first task shares the caller's output (a buffer too, when nested)
+    sinks = [proxy.sink(), *(io.StringIO() for _ in tasks[1:])]
+    outcomes: List[Dict[str, Any]] = [{"result": None, "error": None}] * len(tasks)
+    executor = ThreadPoolExecutor(max_workers=max(1, len(tasks)))
+    try:
+        futures = {executor.submit(proxy.run, task, sink): i for i, (task, sink) in enumerate(zip(tasks, sinks))}
+        for future in as_completed(futures):
+            i = futures[future]
+            outcomes[i] = future.result()
+            if i:
+                proxy.write(sinks[i].getvalue())
+                proxy.flush()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+    finally:
+        if installed:
+            sys.stdout = proxy.target
+
+    for outcome in outcomes:
+        if outcome["error"] is not None:
+            raise outcome["error"]
+    return [outcome["result"] for outcome in outcomes]
+
+
+@lru_cache(maxsize=4096)
+def canon(address: str) -> int:
+    """Canonical numeric form of a hex address, so padding and case don't matter."""
+    return int(address, 16)
+
+
+@lru_cache(maxsize=4096)
 def format_address(address: str, start_chars: int = 10, end_chars: int = 4) -> str:
     """Format a long address for display."""
     if len(address) <= start_chars + end_chars:
@@ -227,6 +602,10 @@ def format_address(address: str, start_chars: int = 10, end_chars: int = 4) -> s
     return f"{address[:start_chars]}...{address[-end_chars:]}"
 
 
+# Dependencies shown in the short deployment summary, in display order
+_SUMMARY_DEPENDENCY_LABELS = (("nft", "NFT"), ("registry", "Registry"), ("token", "Token"))
+
+
 def print_deployment_summary(deployments: List[Dict[str, Any]], network: str):
     """Print a clean summary of all deployments."""
     if not deployments:
@@ -246,13 +625,12 @@ def print_deployment_summary(deployments: List[Dict[str, Any]], network: str):
         print(f"   Class Hash: {format_address(deployment['class_hash'])}")
         
         # Show dependencies if present
-        dependencies = []
-        if deployment.get('nft_address'):
-            dependencies.append(f"NFT: {format_address(deployment['nft_address'])}")
-        if deployment.get('registry_address'):
-            dependencies.append(f"Registry: {format_address(deployment['registry_address'])}")
-        if deployment.get('token_address'):
-            dependencies.append(f"Token: {format_address(deployment['token_address'])}")
+        deployment_deps = deployment.get('dependencies', {})
+        dependencies = [
+            f"{label}: {format_address(deployment_deps[key])}"
+            for key, label in _SUMMARY_DEPENDENCY_LABELS
+            if deployment_deps.get(key)
+        ]
         
         if dependencies:
             print(f"   Dependencies: {', '.join(dependencies)}")
@@ -261,6 +639,20 @@ def print_deployment_summary(deployments: List[Dict[str, Any]], network: str):
     print(f"{Colors.BOLD}{'='*70}{Colors.RESET}")
 
 
+def dumps_indented_bytes(data: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, ready to write to a file."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def dumps_indented(data: Any) -> str:
+    """Serialize to 2-space indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 def print_deployment_json(deployments: List[Dict[str, Any]]):
     """Print deployment addresses in JSON format."""
     if not deployments:
@@ -294,4 +686,4 @@ def print_deployment_json(deployments: List[Dict[str, Any]]):
 
 
     # Print the JSON output
-    print(json.dumps(json_output, indent=2))
+    print(dumps_indented(json_output))
@@ -0,0 +1,209 @@
+"""Tests for the deployer's caches, build skip, multicall file and deploy_many ordering."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kliver_deploy import deployer as deployer_module
+from kliver_deploy.config import ConfigManager
+from kliver_deploy.deployer import ContractDeployer, DeploySpec, deploy_many
+from kliver_deploy.utils import CommandRunner
+
+NFT_ARTIFACT = "target/dev/kliver_on_chain_KliverNFT.contract_class.json"
+REGISTRY_ARTIFACT = "target/dev/kliver_on_chain_KliverRegistry.contract_class.json"
+
+CONFIG = f"""
+environments:
+  dev:
+    name: Development
+    network: sepolia
+    rpc_url: http://node.invalid
+    account: dev
+    contracts:
+      nft:
+        name: kliver_on_chain_KliverNFT
+        sierra_file: {NFT_ARTIFACT}
+        base_uri: https://example.com/nft/
+      registry:
+        name: kliver_on_chain_KliverRegistry
+        sierra_file: {REGISTRY_ARTIFACT}
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A Scarb project with compiled artifacts, isolated caches and no earlier builds."""
+    (tmp_path / "Scarb.toml").write_text('[package]\nname = "kliver_on_chain"\n')
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "lib.cairo").write_text("mod nft;\n")
+    (tmp_path / "target" / "dev").mkdir(parents=True)
+    for artifact in (NFT_ARTIFACT, REGISTRY_ARTIFACT):
+        (tmp_path / artifact).write_text('{"sierra_program": []}')
+    (tmp_path / "deployment_config.yml").write_text(CONFIG)
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(deployer_module, "CLASS_HASH_CACHE_DIR", tmp_path / "cache" / "class_hashes")
+    monkeypatch.setattr(deployer_module, "VALIDATION_CACHE_DIR", tmp_path / "cache" / "validations")
+    forget_in_process_caches(monkeypatch)
+    return tmp_path
+
+
+def forget_in_process_caches(monkeypatch):
+    """Start over as a fresh process would, keeping whatever is on disk."""
+    monkeypatch.setattr(deployer_module, "_declared_classes", {})
+    monkeypatch.setattr(deployer_module, "_loaded_class_caches", set())
+    monkeypatch.setattr(deployer_module, "_validated_contracts", {})
+
+
+def make_deployer(project, contract_type="nft"):
+    return ContractDeployer("dev", contract_type, ConfigManager(project / "deployment_config.yml"))
+
+
+@pytest.fixture
+def declarations(monkeypatch):
+    """Stub out the declare transaction, recording each one that would be sent."""
+    sent = []
+
+    def declare_class(self):
+        sent.append(self.contract_type)
+        return "0xc1a55", None
+
+    monkeypatch.setattr(ContractDeployer, "_declare_class", declare_class)
+    return sent
+
+
+def test_class_hash_cache_miss_then_hit_across_runs(project, monkeypatch, declarations):
+    assert make_deployer(project).declare_contract() == "0xc1a55"
+    assert declarations == ["nft"]
+
+    # A new run reads the class hash back from disk instead of declaring again
+    forget_in_process_caches(monkeypatch)
+    assert make_deployer(project).declare_contract() == "0xc1a55"
+    assert declarations == ["nft"]
+
+
+def test_class_hash_cache_misses_when_artifact_changes(project, monkeypatch, declarations):
+    make_deployer(project).declare_contract()
+    (project / NFT_ARTIFACT).write_text('{"sierra_program": ["0x1"]}')
+
+    forget_in_process_caches(monkeypatch)
+    make_deployer(project).declare_contract()
+    assert declarations == ["nft", "nft"]
+
+
+def test_class_hash_not_cached_until_declaration_confirmed(project, monkeypatch):
+    monkeypatch.setattr(ContractDeployer, "_declare_class", lambda self: ("0xc1a55", "0x7"))
+    monkeypatch.setattr(ContractDeployer, "_await_tx", lambda self, tx_hash, label="": False)
+
+    assert make_deployer(project).declare_contract() is None
+    assert deployer_module._declared_classes == {}
+
+
+def test_validation_cache_hit_miss_and_expiry(project, monkeypatch):
+    calls = []
+
+    def run_command(command, description, show_output=False):
+        calls.append(command)
+        return {"success": True, "stdout": "", "stderr": "", "returncode": 0}
+
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(run_command))
+    now = [1_000_000.0]
+    monkeypatch.setattr(deployer_module.time, "time", lambda: now[0])
+
+    deployer = make_deployer(project, "registry")
+    assert deployer.validate_contract("0xABC", "nft")
+    assert len(calls) == 1
+
+    # Same address in any case, within the TTL: no sncast call, even in a new run
+    forget_in_process_caches(monkeypatch)
+    assert make_deployer(project, "registry").validate_contract("0xabc", "nft")
+    assert len(calls) == 1
+
+    now[0] += deployer.deployment_settings.validation_cache_ttl
+    assert deployer.validate_contract("0xabc", "nft")
+    assert len(calls) == 2
+
+
+def test_build_skipped_until_sources_or_artifacts_change(project, monkeypatch):
+    builds = []
+
+    def run_command(command, description, show_output=False):
+        builds.append(command)
+        return {"success": True, "stdout": "", "stderr": "", "returncode": 0}
+
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(run_command))
+    artifacts = [NFT_ARTIFACT, REGISTRY_ARTIFACT]
+
+    assert ContractDeployer.compile_contract(artifacts)
+    assert ContractDeployer.compile_contract(artifacts)
+    assert len(builds) == 1
+
+    # Editing a source changes its size and mtime, so the fingerprint no longer matches
+    source = project / "src" / "lib.cairo"
+    source.write_text("mod nft;\nmod registry;\n")
+    assert ContractDeployer.compile_contract(artifacts)
+    assert len(builds) == 2
+
+    # A touch alone is enough
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert ContractDeployer.compile_contract(artifacts)
+    assert len(builds) == 3
+
+    # So is a missing artifact of one of the contracts being deployed
+    (project / REGISTRY_ARTIFACT).unlink()
+    assert ContractDeployer.compile_contract(artifacts)
+    assert len(builds) == 4
+
+
+def test_multicall_file_escapes_calldata(project, monkeypatch):
+    tomllib = pytest.importorskip("tomllib")
+    written = {}
+
+    def submit(self, command, description, on_line=None):
+        written["calls"] = tomllib.loads(Path(command[command.index("--path") + 1]).read_text())["call"]
+        return {"success": True, "stdout": '{"transaction_hash": "0x7"}\n', "stderr": "", "returncode": 0}
+
+    monkeypatch.setattr(ContractDeployer, "_submit_transaction", submit)
+    monkeypatch.setattr(ContractDeployer, "_await_tx", lambda self, tx_hash, label="": True)
+
+    awkward = ['say "hi"', "back\\slash", "line\nbreak", "ünïcode", "0x1"]
+    results = make_deployer(project).invoke_multicall([
+        ("0x123", "set_base_uri", awkward),
+        ("0x456", "set_registry_address", ["0x789"]),
+    ])
+
+    assert written["calls"] == [
+        {"call_type": "invoke", "contract_address": "0x123", "function": "set_base_uri", "inputs": awkward},
+        {"call_type": "invoke", "contract_address": "0x456", "function": "set_registry_address", "inputs": ["0x789"]},
+    ]
+    assert [result["tx_hash"] for result in results] == ["0x7", "0x7"]
+
+
+def test_deploy_many_rejects_dependency_cycle_before_any_command(monkeypatch):
+    def no_commands(*args, **kwargs):
+        raise AssertionError("no command should run for an unresolvable spec list")
+
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(no_commands))
+    monkeypatch.setattr(CommandRunner, "run_command_stream", staticmethod(no_commands))
+
+    specs = [
+        DeploySpec("registry", depends_on={"nft_address": "nft"}),
+        DeploySpec("nft", depends_on={"registry_address": "registry"}),
+    ]
+    assert deploy_many("dev", specs) is None
+
+
+def test_deployment_waves_follow_dependencies():
+    specs = [
+        DeploySpec("kliver_pox", depends_on={"registry_address": "registry"}),
+        DeploySpec("registry", depends_on={"nft_address": "nft", "token_simulation_address": "kliver_tokens_core"}),
+        DeploySpec("nft"),
+        DeploySpec("kliver_tokens_core"),
+    ]
+    waves = deployer_module._deployment_waves(specs)
+    assert [[spec.contract_type for spec in wave] for wave in waves] == [
+        ["nft", "kliver_tokens_core"], ["registry"], ["kliver_pox"],
+    ]
+    assert deployer_module._deployment_waves([DeploySpec("registry", depends_on={"nft_address": "nft"})]) is None
@@ -0,0 +1,65 @@
+"""Tests for run_in_parallel output handling and error propagation."""
+
+import sys
+import threading
+
+import pytest
+
+from kliver_deploy.utils import run_in_parallel
+
+
+def test_results_in_task_order_and_buffered_output_kept_together(capsys):
+    second_done = threading.Event()
+
+    def first():
+        print("first start")
+        second_done.wait(5)
+        print("first end")
+        return 1
+
+    def second():
+        print("second a")
+        print("second b")
+        second_done.set()
+        return 2
+
+    assert run_in_parallel(first, second) == [1, 2]
+    # The first task writes live; the second one's block lands as soon as it finishes
+    assert capsys.readouterr().out.splitlines() == ["first start", "second a", "second b", "first end"]
+
+
+def test_nested_calls_stay_inside_the_outer_task_buffer(capsys):
+    def outer():
+        print("outer")
+        return run_in_parallel(lambda: print("inner 0") or 0, lambda: print("inner 1") or 1)
+
+    assert run_in_parallel(lambda: print("live"), outer) == [None, [0, 1]]
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(lines) == ["inner 0", "inner 1", "live", "outer"]
+    # The nested output is written as part of the outer task's block, never split by "live"
+    start = lines.index("outer")
+    assert lines[start:start + 3] == ["outer", "inner 0", "inner 1"]
+
+
+def test_first_exception_in_task_order_is_raised_after_all_finish():
+    finished = []
+
+    def fails(message):
+        def task():
+            raise ValueError(message)
+        return task
+
+    with pytest.raises(ValueError, match="second"):
+        run_in_parallel(lambda: finished.append("first"), fails("second"), fails("third"))
+    assert finished == ["first"]
+
+
+def test_keyboard_interrupt_propagates_and_stdout_is_restored():
+    stdout = sys.stdout
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_in_parallel(lambda: None, interrupted)
+    assert sys.stdout is stdout
@@ -0,0 +1,109 @@
+"""Tests for TransactionWaiter status polling."""
+
+import json
+
+import pytest
+
+from kliver_deploy.utils import CommandRunner, TransactionWaiter
+
+
+def _status(tx_id, finality, execution=None):
+    result = {"finality_status": finality}
+    if execution:
+        result["execution_status"] = execution
+    return {"jsonrpc": "2.0", "id": tx_id, "result": result}
+
+
+@pytest.fixture
+def waiter(monkeypatch):
+    monkeypatch.setattr("kliver_deploy.utils.time.sleep", lambda _: None)
+    return TransactionWaiter("deployer", "http://node.invalid", "sepolia", max_wait=5)
+
+
+def test_batch_response_mapped_by_id(waiter, monkeypatch):
+    sent = []
+
+    def rpc(payload, timeout=10):
+        sent.append(payload)
+        # Batch responses may come back in any order and may include errors
+        return [
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": 29, "message": "Transaction hash not found"}},
+            _status(1, "RECEIVED"),
+            _status(0, "ACCEPTED_ON_L2", "SUCCEEDED"),
+            _status(7, "ACCEPTED_ON_L2"),
+        ]
+
+    monkeypatch.setattr(waiter, "_rpc", rpc)
+
+    assert waiter._confirmed_via_rpc(["0xa", "0xb", "0xc"]) == {"0xa"}
+    assert [call["params"]["transaction_hash"] for call in sent[0]] == ["0xa", "0xb", "0xc"]
+    assert [call["id"] for call in sent[0]] == [0, 1, 2]
+
+
+def test_custom_success_states_match_rpc_spelling(monkeypatch):
+    waiter = TransactionWaiter("deployer", "http://node.invalid", success_states=("AcceptedOnL1",))
+    monkeypatch.setattr(waiter, "_rpc", lambda payload, timeout=10: [
+        _status(0, "ACCEPTED_ON_L2", "SUCCEEDED"),
+        _status(1, "ACCEPTED_ON_L1", "SUCCEEDED"),
+    ])
+
+    assert waiter._confirmed_via_rpc(["0xa", "0xb"]) == {"0xb"}
+
+
+def test_wait_for_all_polls_pending_hashes_together(waiter, monkeypatch):
+    polls = []
+
+    def confirmed(tx_hashes):
+        polls.append(list(tx_hashes))
+        return {tx_hashes[0]}
+
+    monkeypatch.setattr(waiter, "_confirmed_via_rpc", confirmed)
+
+    assert waiter.wait_for_all(["0xa", "0xb", "0xa", "0xc"])
+    assert polls == [["0xa", "0xb", "0xc"], ["0xb", "0xc"], ["0xc"]]
+
+
+def test_falls_back_to_sncast_when_node_unreachable(waiter, monkeypatch):
+    rpc_calls = []
+    commands = []
+
+    def rpc(payload, timeout=10):
+        rpc_calls.append(payload)
+        return None
+
+    def run_command(command, description, **kwargs):
+        commands.append(command)
+        status = {"command": "tx-status", "finality_status": "AcceptedOnL2", "execution_status": "Succeeded"}
+        if command[-1] == "0xb" and sum(c[-1] == "0xb" for c in commands) == 1:
+            status = {"command": "tx-status", "finality_status": "Received"}
+        return {"success": True, "stdout": json.dumps(status) + "\n", "stderr": "", "returncode": 0}
+
+    monkeypatch.setattr(waiter, "_rpc", rpc)
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(run_command))
+
+    assert waiter.wait_for_all(["0xa", "0xb"])
+    # The node is only tried once; every later tick goes straight to sncast
+    assert len(rpc_calls) == 1
+    assert [command[-1] for command in commands] == ["0xa", "0xb", "0xb"]
+    assert all("tx-status" in command for command in commands)
+
+
+def test_sncast_text_output_needs_an_exact_status(waiter, monkeypatch):
+    outputs = iter([
+        "finality_status: AcceptedOnL2\nexecution_status: Reverted\n",
+        "finality_status: NotAcceptedOnL2Yet\n",
+    ])
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(
+        lambda command, description, **kwargs: {"success": True, "stdout": next(outputs), "stderr": "", "returncode": 0}
+    ))
+
+    assert waiter.is_confirmed("0xa")
+    assert not waiter.is_confirmed("0xa")
+
+
+def test_failed_sncast_call_is_not_confirmed(waiter, monkeypatch):
+    monkeypatch.setattr(CommandRunner, "run_command", staticmethod(
+        lambda command, description, **kwargs: {"success": False, "stdout": "AcceptedOnL2", "stderr": "", "returncode": 1}
+    ))
+
+    assert not waiter.is_confirmed("0xa")